@@ -95,8 +95,8 @@ def call_agent(
 
     work_dir = cwd or PROJECT_ROOT
 
-    logger.info(f"Calling agent '{agent_name}' from {work_dir}")
-    logger.debug(f"Command: {' '.join(cmd[:5])}...")
+    logger.info("Calling agent '%s' from %s", agent_name, work_dir)
+    logger.debug("Command: %s...", ' '.join(cmd[:5]))
 
     try:
         result = subprocess.run(
@@ -112,7 +112,7 @@ def call_agent(
             return ""
 
         output = result.stdout.strip()
-        logger.info(f"Agent '{agent_name}' returned {len(output)} characters")
+        logger.info("Agent '%s' returned %s characters", agent_name, len(output))
         return output
 
     except subprocess.TimeoutExpired:
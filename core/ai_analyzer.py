@@ -107,7 +107,10 @@ def call_claude_with_prompt(
         tmp.write(full_prompt)
         tmp_path = tmp.name
 
-    logger.info(f"Calling Claude CLI with prompt: {prompt_file.name}" + (f" (model: {model})" if model else ""))
+    if model:
+        logger.info("Calling Claude CLI with prompt: %s (model: %s)", prompt_file.name, model)
+    else:
+        logger.info("Calling Claude CLI with prompt: %s", prompt_file.name)
 
     try:
         # Use stdin to pass long prompts (avoids "Argument list too long" error)
@@ -168,7 +171,7 @@ def generate_summary(
     Returns:
         Summary markdown text
     """
-    logger.info(f"Generating summary for: {clean_file.name}")
+    logger.info("Generating summary for: %s", clean_file.name)
 
     # Read the cleaned subtitle content
     with open(clean_file, "r", encoding="utf-8") as f:
@@ -313,7 +316,7 @@ def analyze_video(
         AnalysisResult or None if failed
     """
     try:
-        logger.info(f"Analyzing video content {'with agent ' + agent_name if use_agent else 'with Claude CLI'}")
+        logger.info("Analyzing video content %s", 'with agent ' + agent_name if use_agent else 'with Claude CLI')
 
         # Use agent-based analysis
         if use_agent:
@@ -353,7 +356,7 @@ def analyze_video(
             raw_markdown=summary
         )
 
-        logger.info(f"Analysis complete: {len(chapters)} chapters found")
+        logger.info("Analysis complete: %s chapters found", len(chapters))
         return result
 
     except Exception as e:
@@ -459,7 +462,7 @@ def validate_analysis(analysis: AnalysisResult) -> Tuple[bool, List[str]]:
     is_valid = len(issues) == 0
 
     if not is_valid:
-        logger.warning(f"Analysis validation issues: {issues}")
+        logger.warning("Analysis validation issues: %s", issues)
 
     return is_valid, issues
 
@@ -56,7 +56,7 @@ def optimize_chapters(
         logger.warning("No subtitle entries for optimization")
         return []
 
-    logger.info(f"Optimizing {len(chapters)} chapters")
+    logger.info("Optimizing %s chapters", len(chapters))
 
     # Get total duration
     total_duration = subtitle_entries[-1].end_sec - subtitle_entries[0].start_sec
@@ -91,7 +91,7 @@ def optimize_chapters(
             )
         )
 
-    logger.info(f"Optimized to {len(optimized)} chapters")
+    logger.info("Optimized to %s chapters", len(optimized))
     return optimized
 
 
@@ -142,7 +142,7 @@ def _merge_short_chapters(
                 merged.append((ch, end_time))
                 i += 1
 
-        logger.debug(f"Merged short chapter: {ch.title} -> {duration}s")
+        logger.debug("Merged short chapter: %s -> %ss", ch.title, duration)
 
     return merged
 
@@ -174,7 +174,7 @@ def _split_long_chapters(
                 part_ch = ChapterInfo(start_sec=part_start, title=part_title)
                 split.append((part_ch, part_end))
 
-            logger.debug(f"Split long chapter: {ch.title} -> {num_parts} parts")
+            logger.debug("Split long chapter: %s -> %s parts", ch.title, num_parts)
 
     return split
 
@@ -222,7 +222,7 @@ def validate_optimized_chapters(
     is_valid = len(issues) == 0
 
     if not is_valid:
-        logger.warning(f"Optimized chapter validation issues: {issues}")
+        logger.warning("Optimized chapter validation issues: %s", issues)
 
     return is_valid, issues
 
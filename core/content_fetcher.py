@@ -16,6 +16,9 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# ASCII and Unicode problematic filename characters (including smart quotes)
+_FILENAME_BAD_CHARS = re.compile(r'[<>:"/\\|?*""''`'']')
+
 
 @dataclass
 class VideoMetadata:
@@ -73,7 +76,7 @@ def fetch_video_info(video_id: str) -> Optional[VideoMetadata]:
     url = f"https://www.youtube.com/watch?v={video_id}"
 
     try:
-        logger.debug(f"Fetching metadata for {video_id}")
+        logger.debug("Fetching metadata for %s", video_id)
 
         # Use yt-dlp to extract metadata (JSON format for complete info)
         cmd = [
@@ -99,7 +102,7 @@ def fetch_video_info(video_id: str) -> Optional[VideoMetadata]:
                     description="",
                     url=url,
                 )
-            logger.warning(f"yt-dlp failed for {video_id}: {result.stderr}")
+            logger.warning("yt-dlp failed for %s: %s", video_id, result.stderr)
             return None
 
         data = json.loads(result.stdout)
@@ -114,7 +117,7 @@ def fetch_video_info(video_id: str) -> Optional[VideoMetadata]:
             url=url,
         )
 
-        logger.debug(f"Got metadata: {metadata.title[:50]}... ({metadata.duration_sec}s)")
+        logger.debug("Got metadata: %s... (%ss)", metadata.title[:50], metadata.duration_sec)
         return metadata
 
     except subprocess.TimeoutExpired:
@@ -151,8 +154,7 @@ def sanitize_filename(title: str, max_length: int = 50) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove ASCII and Unicode problematic characters (including smart quotes)
-    title = re.sub(r'[<>:"/\\|?*""''`'']', '', title)
+    title = _FILENAME_BAD_CHARS.sub('', title)
     title = title.replace(' ', '_')
     if len(title) > max_length:
         title = title[:max_length]
@@ -196,13 +198,13 @@ def download_subtitle(youtube_url: str, output_dir: Path, language: str = "en")
         youtube_url
     ]
 
-    logger.info(f"Downloading subtitle...")
+    logger.info("Downloading subtitle...")
 
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
 
         if result.returncode != 0:
-            logger.warning(f"yt-dlp error: {result.stderr}")
+            logger.warning("yt-dlp error: %s", result.stderr)
             return None, None
 
         # Find the downloaded file
@@ -230,7 +232,7 @@ def download_subtitle(youtube_url: str, output_dir: Path, language: str = "en")
         with open(srt_file, "r", encoding="utf-8") as f:
             raw_srt = f.read()
 
-        logger.info(f"Subtitle downloaded: {srt_file.name}")
+        logger.info("Subtitle downloaded: %s", srt_file.name)
         return str(srt_file), raw_srt
 
     except subprocess.TimeoutExpired:
@@ -271,10 +273,10 @@ def check_video_availability(video_id: str) -> bool:
     """
     metadata = fetch_video_info(video_id)
     if metadata is None:
-        logger.warning(f"Video {video_id} is not available")
+        logger.warning("Video %s is not available", video_id)
         return False
 
-    logger.debug(f"Video {video_id} is available")
+    logger.debug("Video %s is available", video_id)
     return True
 
 
@@ -289,7 +291,7 @@ def verify_subtitle_file(file_path: str) -> bool:
         True if valid
     """
     if not os.path.exists(file_path):
-        logger.warning(f"Subtitle file not found: {file_path}")
+        logger.warning("Subtitle file not found: %s", file_path)
         return False
 
     try:
@@ -297,10 +299,10 @@ def verify_subtitle_file(file_path: str) -> bool:
             content = f.read(1000)  # Read first 1KB
 
         if not content:
-            logger.warning(f"Subtitle file is empty: {file_path}")
+            logger.warning("Subtitle file is empty: %s", file_path)
             return False
 
-        logger.debug(f"Subtitle file is valid: {file_path}")
+        logger.debug("Subtitle file is valid: %s", file_path)
         return True
 
     except Exception as e:
@@ -14,6 +14,19 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# ASCII and Unicode problematic filename characters (including smart quotes)
+_FILENAME_BAD_CHARS = re.compile(r'[<>:"/\\|?*""''`'']')
+
+# Markers required by validate_output, found in a single scan
+_REQUIRED_MARKERS = re.compile(r"^# |摘要|TL;DR|翻译|Translation", re.MULTILINE)
+_MARKER_SECTIONS = {
+    "# ": "title",
+    "摘要": "summary",
+    "TL;DR": "summary",
+    "翻译": "translation",
+    "Translation": "translation",
+}
+
 
 def sanitize_filename(title: str, max_length: int = 50) -> str:
     """
@@ -26,8 +39,7 @@ def sanitize_filename(title: str, max_length: int = 50) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove ASCII and Unicode problematic characters (including smart quotes)
-    title = re.sub(r'[<>:"/\\|?*""''`'']', '', title)
+    title = _FILENAME_BAD_CHARS.sub('', title)
     title = title.replace(' ', '_')
     if len(title) > max_length:
         title = title[:max_length]
@@ -44,14 +56,12 @@ def format_duration(seconds: int) -> str:
     Returns:
         Formatted duration (e.g., "1:23:45" or "23:45")
     """
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
+    hours, rem = divmod(int(seconds), 3600)
+    minutes, secs = divmod(rem, 60)
 
     if hours > 0:
         return f"{hours}:{minutes:02d}:{secs:02d}"
-    else:
-        return f"{minutes}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
 
 
 def generate_markdown(
@@ -172,17 +182,18 @@ def save_output(
     filename = f"{safe_title}_translate.md"
     file_path = output_path / filename
 
-    # Handle filename conflicts
-    if file_path.exists():
+    # Write file; exclusive create detects a name conflict in the same call
+    try:
+        with open(file_path, "x", encoding="utf-8") as f:
+            f.write(markdown_content)
+    except FileExistsError:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{safe_title}_{timestamp}_translate.md"
         file_path = output_path / filename
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(markdown_content)
 
-    # Write file
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(markdown_content)
-
-    logger.info(f"Output saved to: {file_path}")
+    logger.info("Output saved to: %s", file_path)
     return str(file_path)
 
 
@@ -242,22 +253,25 @@ def validate_output(markdown_content: str) -> Tuple[bool, List[str]]:
         issues.append("Markdown content is empty")
         return False, issues
 
-    # Check for title
-    if not re.search(r"^# ", markdown_content, re.MULTILINE):
+    found = set()
+    for match in _REQUIRED_MARKERS.finditer(markdown_content):
+        found.add(_MARKER_SECTIONS[match.group()])
+        if len(found) == 3:
+            break
+
+    if "title" not in found:
         issues.append("Missing main title (# header)")
 
-    # Check for summary section
-    if "摘要" not in markdown_content and "TL;DR" not in markdown_content:
+    if "summary" not in found:
         issues.append("Missing summary section")
 
-    # Check for translation section
-    if "翻译" not in markdown_content and "Translation" not in markdown_content:
+    if "translation" not in found:
         issues.append("Missing translation section")
 
     is_valid = len(issues) == 0
 
     if not is_valid:
-        logger.warning(f"Output validation issues: {issues}")
+        logger.warning("Output validation issues: %s", issues)
 
     return is_valid, issues
 
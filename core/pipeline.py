@@ -91,7 +91,7 @@ def process_video(
         is_academic = True
         use_agent_override = False  # Force disable agent for academic content
         tags = channel_config.tags if hasattr(channel_config, 'tags') else channel_config.get('tags', [])
-        logger.info(f"[{video_id}] 检测到学术频道 tags={tags}，使用学术 prompts")
+        logger.info("[%s] 检测到学术频道 tags=%s，使用学术 prompts", video_id, tags)
     else:
         # Default: use investment/general prompts
         prompt_summary = prompts_dir / "yt-summary.md"
@@ -99,25 +99,25 @@ def process_video(
 
     # Fallback mechanism: if prompt file doesn't exist, use default
     if not prompt_summary.exists():
-        logger.warning(f"Prompt not found: {prompt_summary}, falling back to default")
+        logger.warning("Prompt not found: %s, falling back to default", prompt_summary)
         prompt_summary = prompts_dir / "yt-summary.md"
     if not prompt_translate.exists():
-        logger.warning(f"Prompt not found: {prompt_translate}, falling back to default")
+        logger.warning("Prompt not found: %s, falling back to default", prompt_translate)
         prompt_translate = prompts_dir / "yt-translate.md"
 
-    logger.info(f"[{video_id}] Starting pipeline processing...")
+    logger.info("[%s] Starting pipeline processing...", video_id)
 
     try:
         # Stage 1: Fetch video info
-        logger.info(f"[{video_id}] Stage 1: Fetching video information...")
+        logger.info("[%s] Stage 1: Fetching video information...", video_id)
         video_info = fetch_video_info(video_id)
         if not video_info:
             return _create_failed_result(video_id, "Failed to fetch video info", "video_info", start_time)
 
-        logger.info(f"[{video_id}] ✓ Got video: {video_info.title}")
+        logger.info("[%s] ✓ Got video: %s", video_id, video_info.title)
 
         # Stage 2: Download subtitles
-        logger.info(f"[{video_id}] Stage 2: Downloading subtitles...")
+        logger.info("[%s] Stage 2: Downloading subtitles...", video_id)
         output_dir = Path(config.output_dir)
         srt_dir = output_dir / "srt" / sanitize_filename(video_info.channel)
         srt_path, raw_srt = download_subtitle(video_id, srt_dir, config.subtitle_language)
@@ -125,14 +125,14 @@ def process_video(
         if not srt_path or not raw_srt:
             return _create_failed_result(video_id, "Failed to download subtitles", "subtitle_download", start_time, video_info.title)
 
-        logger.info(f"[{video_id}] ✓ Downloaded subtitles: {srt_path}")
+        logger.info("[%s] ✓ Downloaded subtitles: %s", video_id, srt_path)
 
         # Check minimum duration (skip if skip_filters is True)
         srt_entries = parse_srt(raw_srt)
         is_long_enough, duration_str = check_minimum_duration(srt_entries, config.min_duration_minutes)
 
         if not is_long_enough and not skip_filters:
-            logger.info(f"[{video_id}] Skipping: duration {duration_str} < minimum {config.min_duration_minutes} min")
+            logger.info("[%s] Skipping: duration %s < minimum %s min", video_id, duration_str, config.min_duration_minutes)
             archive.mark_skipped(video_id, video_info.title, f"Duration too short: {duration_str}")
             return PipelineResult(
                 video_id=video_id,
@@ -145,10 +145,10 @@ def process_video(
                 processing_time=(datetime.now() - start_time).total_seconds()
             )
         elif not is_long_enough and skip_filters:
-            logger.info(f"[{video_id}] Duration {duration_str} < minimum, but skip_filters=True, continuing...")
+            logger.info("[%s] Duration %s < minimum, but skip_filters=True, continuing...", video_id, duration_str)
 
         # Stage 3: Process subtitles
-        logger.info(f"[{video_id}] Stage 3: Processing subtitles...")
+        logger.info("[%s] Stage 3: Processing subtitles...", video_id)
         video_url = f"https://www.youtube.com/watch?v={video_id}"
         subtitle_data = process_subtitle_file(
             srt_path,
@@ -168,7 +168,7 @@ def process_video(
         with open(clean_file, "w", encoding="utf-8") as f:
             f.write(subtitle_data.with_metadata)
 
-        logger.info(f"[{video_id}] ✓ Processed subtitles ({len(srt_entries)} entries)")
+        logger.info("[%s] ✓ Processed subtitles (%s entries)", video_id, len(srt_entries))
 
         # Stage 4: AI Analysis
         # Academic content overrides agent setting
@@ -176,10 +176,10 @@ def process_video(
         agent_name = getattr(config, 'agent_name', 'tech-investment-analyst')
 
         if use_agent:
-            logger.info(f"[{video_id}] Stage 4: Analyzing video with Agent '{agent_name}'...")
+            logger.info("[%s] Stage 4: Analyzing video with Agent '%s'...", video_id, agent_name)
         else:
             mode = "Academic Mode" if is_academic else "Standard Mode"
-            logger.info(f"[{video_id}] Stage 4: Analyzing video with Claude CLI ({mode})...")
+            logger.info("[%s] Stage 4: Analyzing video with Claude CLI (%s)...", video_id, mode)
 
         # Read subtitle content for analysis
         with open(clean_file, 'r', encoding='utf-8') as f:
@@ -201,7 +201,7 @@ def process_video(
 
         if not analysis_result:
             # Fallback to direct generate_summary if analyze_video fails
-            logger.warning(f"[{video_id}] analyze_video failed, trying generate_summary...")
+            logger.warning("[%s] analyze_video failed, trying generate_summary...", video_id)
             summary = generate_summary(
                 clean_file,
                 prompt_summary,
@@ -221,7 +221,7 @@ def process_video(
 
         # Fallback chapters if none found
         if not chapters:
-            logger.warning(f"[{video_id}] No chapters found, using fallback")
+            logger.warning("[%s] No chapters found, using fallback", video_id)
             duration_sec = get_duration_from_entries(srt_entries)
             interval = config.fallback_chapter_interval
             chapters = [(0, "完整视频")]
@@ -230,13 +230,13 @@ def process_video(
                 for i in range(0, duration_sec, interval):
                     chapters.append((i, f"Part {i // interval + 1}"))
 
-        logger.info(f"[{video_id}] ✓ Analysis complete ({len(chapters)} chapters, type: {video_type})")
+        logger.info("[%s] ✓ Analysis complete (%s chapters, type: %s)", video_id, len(chapters), video_type)
 
         # Stage 5: Translation
         if use_agent:
-            logger.info(f"[{video_id}] Stage 5: Translating {len(chapters)} chapters with Agent '{agent_name}'...")
+            logger.info("[%s] Stage 5: Translating %s chapters with Agent '%s'...", video_id, len(chapters), agent_name)
         else:
-            logger.info(f"[{video_id}] Stage 5: Translating {len(chapters)} chapters...")
+            logger.info("[%s] Stage 5: Translating %s chapters...", video_id, len(chapters))
 
         translations, failed_chapters = translate_chapters(
             summary=summary,
@@ -254,10 +254,10 @@ def process_video(
             agent_name=agent_name
         )
 
-        logger.info(f"[{video_id}] ✓ Translation complete ({len(translations)}/{len(chapters)} successful)")
+        logger.info("[%s] ✓ Translation complete (%s/%s successful)", video_id, len(translations), len(chapters))
 
         # Stage 6: Generate Markdown
-        logger.info(f"[{video_id}] Stage 6: Generating markdown output...")
+        logger.info("[%s] Stage 6: Generating markdown output...", video_id)
 
         duration_sec = get_duration_from_entries(srt_entries)
         markdown_content = generate_markdown(
@@ -274,7 +274,7 @@ def process_video(
         # Stage 6.5: Review and restructure (optional)
         review_enabled = getattr(config, 'review_enabled', False)
         if review_enabled:
-            logger.info(f"[{video_id}] Stage 6.5: Reviewing and restructuring...")
+            logger.info("[%s] Stage 6.5: Reviewing and restructuring...", video_id)
             from core.reviewer import review_content
 
             remove_garbage = getattr(config, 'review_remove_ai_garbage', False)
@@ -287,12 +287,12 @@ def process_video(
 
             if reviewed_content:
                 markdown_content = reviewed_content
-                logger.info(f"[{video_id}] ✓ Review complete")
+                logger.info("[%s] ✓ Review complete", video_id)
             else:
-                logger.warning(f"[{video_id}] Review failed, using original content")
+                logger.warning("[%s] Review failed, using original content", video_id)
 
         # Stage 7: Save output
-        logger.info(f"[{video_id}] Stage 7: Saving output file...")
+        logger.info("[%s] Stage 7: Saving output file...", video_id)
 
         output_path = save_output(
             markdown_content,
@@ -302,15 +302,15 @@ def process_video(
             filename_max_length=config.filename_max_length
         )
 
-        logger.info(f"[{video_id}] ✓ Saved to {output_path}")
+        logger.info("[%s] ✓ Saved to %s", video_id, output_path)
 
         # Stage 8: Archive
-        logger.info(f"[{video_id}] Stage 8: Archiving result...")
+        logger.info("[%s] Stage 8: Archiving result...", video_id)
         archive.mark_processed(video_id, video_info.title, output_path, len(failed_chapters))
 
         # Success
         elapsed = (datetime.now() - start_time).total_seconds()
-        logger.info(f"[{video_id}] ✅ COMPLETE - {video_info.title} ({elapsed:.1f}s)")
+        logger.info("[%s] ✅ COMPLETE - %s (%.1fs)", video_id, video_info.title, elapsed)
 
         return PipelineResult(
             video_id=video_id,
@@ -365,7 +365,7 @@ def run_pipeline(
     target_channels = channels if channels else config.channels
     channels_file = Path("channels.json")
 
-    logger.info(f"Processing {len(target_channels)} channel(s)...")
+    logger.info("Processing %s channel(s)...", len(target_channels))
 
     for channel in target_channels:
         # Handle both ChannelConfig objects and dicts
@@ -388,14 +388,14 @@ def run_pipeline(
             channel_dict = channel
             channel_config = channel  # Use the dict directly
 
-        logger.info(f"Checking channel: {channel_name}")
+        logger.info("Checking channel: %s", channel_name)
 
         try:
             # Fetch new videos from RSS
             videos = fetch_channel_videos_rss(channel_dict, config.lookback_hours, channels_file)
             new_videos = filter_new_videos_rss(videos, archive)
 
-            logger.info(f"Found {len(new_videos)}/{len(videos)} new videos")
+            logger.info("Found %s/%s new videos", len(new_videos), len(videos))
 
             # Process each video
             for video in new_videos:
@@ -459,7 +459,7 @@ def run_loop(config_path: str = "config_ai.json", archive_path: str = None, emai
             archive = load_archive(actual_archive_path)
 
             interval_hours = getattr(config, 'check_interval_hours', 3)
-            logger.info(f"Config loaded: {len(config.channels)} channels, interval={interval_hours}h")
+            logger.info("Config loaded: %s channels, interval=%sh", len(config.channels), interval_hours)
 
             # Run pipeline with fresh config
             run_pipeline(config, archive, email_enabled=email_enabled)
@@ -471,7 +471,7 @@ def run_loop(config_path: str = "config_ai.json", archive_path: str = None, emai
         if interval_hours == 0:
             break
 
-        logger.info(f"Sleeping for {interval_hours} hours...")
+        logger.info("Sleeping for %s hours...", interval_hours)
         time.sleep(interval_hours * 3600)
 
 
@@ -487,22 +487,22 @@ def print_summary(
     logger.info("=" * 60)
     logger.info("PROCESSING SUMMARY")
     logger.info("=" * 60)
-    logger.info(f"Total videos: {total}")
-    logger.info(f"Successful: {len(successful)}")
-    logger.info(f"Failed: {len(failed)}")
-    logger.info(f"Total time: {elapsed_total:.1f}s")
+    logger.info("Total videos: %s", total)
+    logger.info("Successful: %s", len(successful))
+    logger.info("Failed: %s", len(failed))
+    logger.info("Total time: %.1fs", elapsed_total)
 
     if successful:
         logger.info("")
         logger.info("✅ SUCCESSFUL:")
         for result in successful:
-            logger.info(f"  • {result.title} - {result.processing_time:.1f}s")
+            logger.info("  • %s - %.1fs", result.title, result.processing_time)
 
     if failed:
         logger.info("")
         logger.info("❌ FAILED:")
         for result in failed:
-            logger.info(f"  • {result.title} - {result.stage_failed}: {result.error}")
+            logger.info("  • %s - %s: %s", result.title, result.stage_failed, result.error)
 
     logger.info("=" * 60)
 
@@ -74,7 +74,7 @@ def parse_chapter_table(markdown_content: str) -> List[Tuple[int, int, str, str]
         if start_sec < end_sec and title:
             chapters.append((start_sec, end_sec, title, summary))
 
-    logger.info(f"解析到 {len(chapters)} 个章节")
+    logger.info("解析到 %s 个章节", len(chapters))
     return chapters
 
 
@@ -111,7 +111,7 @@ def parse_translation_blocks(markdown_content: str) -> List[Tuple[int, int, str]
             content = content.strip()
             if content:
                 blocks.append((start_sec, end_sec, content))
-        logger.info(f"解析到 {len(blocks)} 个细分时间戳块")
+        logger.info("解析到 %s 个细分时间戳块", len(blocks))
     else:
         # 尝试匹配章节标题格式: ### (0:00 - 15:00) ... 或 ### (15:00 - End) ...
         chapter_pattern = r'###\s*\((\d{1,2}:\d{2}(?::\d{2})?)\s*[-–]\s*(\d{1,2}:\d{2}(?::\d{2})?|End)\)\s*[^\n]*\n+(.*?)(?=###\s*\(|\Z)'
@@ -125,7 +125,7 @@ def parse_translation_blocks(markdown_content: str) -> List[Tuple[int, int, str]
             content = content.strip()
             if content:
                 blocks.append((start_sec, end_sec, content))
-        logger.info(f"解析到 {len(blocks)} 个章节翻译块")
+        logger.info("解析到 %s 个章节翻译块", len(blocks))
 
     return blocks
 
@@ -213,7 +213,7 @@ def remove_fine_timestamps(markdown_content: str) -> str:
     removed_count = (original_len - len(result)) // 20  # 估算删除的时间戳数量
 
     if removed_count > 0:
-        logger.info(f"删除了约 {removed_count} 个细分时间戳")
+        logger.info("删除了约 %s 个细分时间戳", removed_count)
 
     return result
 
@@ -56,7 +56,7 @@ def process_subtitle_file(
         ProcessedSubtitles object or None if failed
     """
     try:
-        logger.info(f"Processing subtitle file: {file_path}")
+        logger.info("Processing subtitle file: %s", file_path)
 
         # Read raw SRT
         with open(file_path, "r", encoding="utf-8") as f:
@@ -111,7 +111,7 @@ def process_subtitle_text(
     # Generate text with metadata header
     with_metadata = _inject_metadata(cleaned_text, title, channel, video_url, entries)
 
-    logger.info(f"Processed {len(entries)} subtitle entries")
+    logger.info("Processed %s subtitle entries", len(entries))
 
     return ProcessedSubtitles(
         raw_text=raw_text,
@@ -177,7 +177,7 @@ def save_clean_subtitle(
     with open(output_path, "w", encoding="utf-8") as f:
         f.write(subtitle_data.clean_text)
 
-    logger.info(f"Saved clean subtitle to {output_path}")
+    logger.info("Saved clean subtitle to %s", output_path)
     return str(output_path)
 
 
@@ -302,9 +302,9 @@ def split_by_chapters(
         if chapter_entries:
             time_range = f"{format_time(chapter_start)} - {format_time(chapter_end) if chapter_end else 'End'}"
             result.append((time_range, chapter_title, chapter_entries))
-            logger.debug(f"Chapter '{chapter_title}': {len(chapter_entries)} entries")
+            logger.debug("Chapter '%s': %s entries", chapter_title, len(chapter_entries))
 
-    logger.info(f"Split {len(entries)} entries into {len(result)} chapters")
+    logger.info("Split %s entries into %s chapters", len(entries), len(result))
     return result
 
 
@@ -337,9 +337,9 @@ def validate_subtitles(entries: List[Tuple[int, int, str]]) -> Tuple[bool, List[
     is_valid = len(issues) == 0
 
     if is_valid:
-        logger.info(f"Subtitle validation passed: {len(entries)} entries")
+        logger.info("Subtitle validation passed: %s entries", len(entries))
     else:
-        logger.warning(f"Subtitle validation issues: {issues}")
+        logger.warning("Subtitle validation issues: %s", issues)
 
     return is_valid, issues
 
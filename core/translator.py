@@ -17,7 +17,7 @@ from dataclasses import dataclass
 
 from core.ai_analyzer import get_claude_cli_path, CLAUDE_CLI
 from core.agent_caller import call_agent, AGENT_TECH_INVESTMENT
-from utils.srt_parser import format_time, get_segment_text, get_last_lines
+from utils.srt_parser import SubtitleIndex, format_time, get_segment_text, get_last_lines
 
 logger = logging.getLogger(__name__)
 
@@ -79,7 +79,7 @@ def call_agent_translate(
     if not prompt:
         return ""
 
-    logger.info(f"Calling agent '{agent_name}' for translation")
+    logger.info("Calling agent '%s' for translation", agent_name)
     return call_agent(agent_name, prompt, timeout)
 
 
@@ -106,7 +106,10 @@ def call_claude_translate(
     if not prompt:
         return ""
 
-    logger.info(f"Calling Claude CLI for translation" + (f" (model: {model})" if model else ""))
+    if model:
+        logger.info("Calling Claude CLI for translation (model: %s)", model)
+    else:
+        logger.info("Calling Claude CLI for translation")
 
     try:
         cmd = [
@@ -192,9 +195,9 @@ def translate_chapter(
     }
 
     if use_agent:
-        logger.info(f"Translating chapter with Agent '{agent_name}': {time_range} - {chapter_title}")
+        logger.info("Translating chapter with Agent '%s': %s - %s", agent_name, time_range, chapter_title)
     else:
-        logger.info(f"Translating chapter: {time_range} - {chapter_title}")
+        logger.info("Translating chapter: %s - %s", time_range, chapter_title)
 
     # Retry logic
     for attempt in range(max_retries + 1):
@@ -219,7 +222,7 @@ def translate_chapter(
         except Exception as e:
             if attempt < max_retries:
                 wait_time = retry_delay * (2 ** attempt)
-                logger.warning(f"Translation attempt {attempt + 1} failed, retrying in {wait_time}s: {e}")
+                logger.warning("Translation attempt %s failed, retrying in %ss: %s", attempt + 1, wait_time, e)
                 time.sleep(wait_time)
             else:
                 logger.error(f"Translation failed after {max_retries + 1} attempts: {e}")
@@ -284,6 +287,7 @@ def translate_chapters(
     from utils.srt_parser import parse_srt_full
 
     srt_entries = parse_srt_full(raw_srt)
+    srt_index = SubtitleIndex(srt_entries)
     translations = []
     failed_chapters = []
     previous_original = ""
@@ -294,9 +298,9 @@ def translate_chapters(
         time_range = f"{format_time(start_sec)} - {format_time(end_sec) if end_sec else 'End'}"
 
         # Extract segment text
-        segment_text = get_segment_text(srt_entries, start_sec, end_sec)
+        segment_text = get_segment_text(srt_entries, start_sec, end_sec, srt_index)
         if not segment_text.strip():
-            logger.warning(f"No text for chapter {i}: {title}")
+            logger.warning("No text for chapter %s: %s", i, title)
             continue
 
         # Translate
@@ -332,7 +336,7 @@ def translate_chapters(
                 "error": result.error_message
             })
 
-    logger.info(f"Translation complete: {len(translations)}/{len(chapters)} successful")
+    logger.info("Translation complete: %s/%s successful", len(translations), len(chapters))
     return translations, failed_chapters
 
 
@@ -371,16 +375,17 @@ def translate_all_chapters(
 
     video_type = analysis.video_type if hasattr(analysis, 'video_type') else "访谈对话"
     speakers = analysis.speakers if hasattr(analysis, 'speakers') else ""
+    srt_index = SubtitleIndex(srt_entries)
 
     for i, (start_sec, title) in enumerate(chapters):
         end_sec = chapters[i + 1][0] if i + 1 < len(chapters) else None
         time_range = f"{format_time(start_sec)} - {format_time(end_sec) if end_sec else 'End'}"
 
         # Extract segment text
-        segment_text = get_segment_text(srt_entries, start_sec, end_sec)
+        segment_text = get_segment_text(srt_entries, start_sec, end_sec, srt_index)
 
         if not segment_text.strip():
-            logger.warning(f"No text for chapter {i}: {title}")
+            logger.warning("No text for chapter %s: %s", i, title)
             results.append(TranslationResult(
                 chapter_idx=i,
                 chapter_title=title,
@@ -418,7 +423,7 @@ def translate_all_chapters(
         else:
             failed_indices.append(i)
 
-    logger.info(f"Translation complete: {len(results) - len(failed_indices)}/{len(results)} successful")
+    logger.info("Translation complete: %s/%s successful", len(results) - len(failed_indices), len(results))
     return results, failed_indices
 
 
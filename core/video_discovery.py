@@ -49,7 +49,7 @@ def get_channel_id(channel: dict, channels_file: Optional[Path] = None) -> str:
     if not url:
         return ""
 
-    logger.info(f"Extracting channel ID for: {channel.get('name', url)}")
+    logger.info("Extracting channel ID for: %s", channel.get('name', url))
 
     try:
         result = subprocess.run(
@@ -85,7 +85,7 @@ def _update_channel_id_cache(channels_file: Path, handle: str, channel_id: str)
         with open(channels_file, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
     except Exception as e:
-        logger.warning(f"Could not update channel ID cache: {e}")
+        logger.warning("Could not update channel ID cache: %s", e)
 
 
 def get_rss_url(channel: dict, channels_file: Optional[Path] = None) -> str:
@@ -133,16 +133,16 @@ def fetch_channel_videos_rss(channel: dict, lookback_hours: int,
     """
     rss_url = get_rss_url(channel, channels_file)
     if not rss_url:
-        logger.warning(f"No RSS URL for channel: {channel.get('name')}")
+        logger.warning("No RSS URL for channel: %s", channel.get('name'))
         return []
 
-    logger.info(f"Fetching RSS: {channel.get('name')}")
+    logger.info("Fetching RSS: %s", channel.get('name'))
 
     try:
         feed = feedparser.parse(rss_url)
 
         if feed.bozo:
-            logger.warning(f"RSS parse error for {channel.get('name')}: {feed.bozo_exception}")
+            logger.warning("RSS parse error for %s: %s", channel.get('name'), feed.bozo_exception)
 
         cutoff = datetime.now() - timedelta(hours=lookback_hours)
         videos = []
@@ -179,7 +179,7 @@ def fetch_channel_videos_rss(channel: dict, lookback_hours: int,
                 channel=channel.get("name", "Unknown")
             ))
 
-        logger.info(f"  Found {len(videos)} videos within lookback window")
+        logger.info("  Found %s videos within lookback window", len(videos))
         return videos
 
     except Exception as e:
@@ -201,14 +201,14 @@ def fetch_channel_videos(channel_id: str, lookback_hours: int = 24) -> List[str]
     rss_url = get_channel_rss_url(channel_id)
 
     try:
-        logger.info(f"Fetching RSS feed for channel {channel_id}")
+        logger.info("Fetching RSS feed for channel %s", channel_id)
         feed = feedparser.parse(rss_url)
 
         if feed.bozo:
-            logger.warning(f"RSS parsing issues for {channel_id}: {feed.bozo_exception}")
+            logger.warning("RSS parsing issues for %s: %s", channel_id, feed.bozo_exception)
 
         if not feed.entries:
-            logger.warning(f"No entries found in feed for {channel_id}")
+            logger.warning("No entries found in feed for %s", channel_id)
             return []
 
         video_ids = []
@@ -228,7 +228,7 @@ def fetch_channel_videos(channel_id: str, lookback_hours: int = 24) -> List[str]
                         published_str.replace("Z", "+00:00")
                     )
                     if published.replace(tzinfo=None) < cutoff:
-                        logger.debug(f"Skipping old video: {video_id}")
+                        logger.debug("Skipping old video: %s", video_id)
                         continue
                 except Exception:
                     pass  # Include if date parsing fails
@@ -236,10 +236,10 @@ def fetch_channel_videos(channel_id: str, lookback_hours: int = 24) -> List[str]
                 video_ids.append(video_id)
 
             except Exception as e:
-                logger.warning(f"Failed to parse RSS entry: {e}")
+                logger.warning("Failed to parse RSS entry: %s", e)
                 continue
 
-        logger.info(f"Found {len(video_ids)} recent videos in {channel_id}")
+        logger.info("Found %s recent videos in %s", len(video_ids), channel_id)
         return video_ids
 
     except Exception as e:
@@ -273,7 +273,7 @@ def extract_video_id(url: str) -> Optional[str]:
         # Already a video ID
         return url
 
-    logger.warning(f"Could not extract video ID from: {url}")
+    logger.warning("Could not extract video ID from: %s", url)
     return None
 
 
@@ -316,7 +316,7 @@ def filter_new_videos(video_ids: List[str], archive) -> List[str]:
     new_videos = [vid for vid in video_ids if vid not in processed]
 
     if new_videos:
-        logger.info(f"Found {len(new_videos)} new videos (skipped {len(video_ids) - len(new_videos)})")
+        logger.info("Found %s new videos (skipped %s)", len(new_videos), len(video_ids) - len(new_videos))
     else:
         logger.info("No new videos found")
 
@@ -342,7 +342,7 @@ def filter_new_videos_rss(videos: List[VideoInfo], archive) -> List[VideoInfo]:
         new_videos = [v for v in videos if v.video_id not in archive]
 
     if new_videos:
-        logger.info(f"Found {len(new_videos)} new videos (skipped {len(videos) - len(new_videos)})")
+        logger.info("Found %s new videos (skipped %s)", len(new_videos), len(videos) - len(new_videos))
     else:
         logger.info("No new videos found")
 
@@ -375,8 +375,8 @@ def fetch_and_filter_videos(
         new_videos = filter_new_videos(all_videos, archive)
 
         logger.info(
-            f"Channel {channel_id}: "
-            f"{len(all_videos)} recent, {len(new_videos)} new"
+            "Channel %s: %s recent, %s new",
+            channel_id, len(all_videos), len(new_videos),
         )
 
         return new_videos
@@ -6,6 +6,7 @@ from .notifier import (
     send_update_email,
     send_notification,
     load_email_config,
+    EmailConfig,
 )
 
 __all__ = [
@@ -15,4 +16,5 @@ __all__ = [
     "send_update_email",
     "send_notification",
     "load_email_config",
+    "EmailConfig",
 ]
@@ -4,16 +4,29 @@ import json
 import os
 import logging
 from datetime import datetime
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, FrozenSet, Optional, Set
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
 
 logger = logging.getLogger(__name__)
 
+# json.dump emits many small fragments; a larger buffer batches them into
+# fewer write() syscalls per save
+_WRITE_BUFFER_SIZE = 1 << 17
+
 
 @staticmethod
 def _ensure_dict_structure(data: Dict) -> Dict:
     """Ensure archive data has required structure."""
     if "processed" not in data:
         data["processed"] = {}
+    elif isinstance(data["processed"], list):
+        # Legacy archives stored processed videos as a plain ID list
+        data["processed"] = {video_id: {} for video_id in data["processed"]}
     if "failed" not in data:
         data["failed"] = {}
     if "stats" not in data:
@@ -28,26 +41,29 @@ def _ensure_dict_structure(data: Dict) -> Dict:
 class Archive:
     """Manage archive of processed videos."""
 
-    def __init__(self, archive_path: str = "youtube_archive.json"):
+    def __init__(self, archive_path: Optional[str] = "youtube_archive.json"):
         """
         Initialize archive manager.
 
         Args:
-            archive_path: Path to archive JSON file
+            archive_path: Path to archive JSON file, or None to keep the
+                archive in memory only (nothing is read or written)
         """
         self.archive_path = archive_path
         self._load()
 
     def _load(self) -> None:
         """Load archive from file or create new one."""
-        if os.path.exists(self.archive_path):
+        if self.archive_path is None:
+            self.data = _ensure_dict_structure({})
+        elif os.path.exists(self.archive_path):
             try:
                 with open(self.archive_path, "r", encoding="utf-8") as f:
                     self.data = json.load(f)
                     self.data = _ensure_dict_structure(self.data)
-                logger.debug(f"Archive loaded: {self.archive_path}")
+                logger.debug("Archive loaded: %s", self.archive_path)
             except json.JSONDecodeError as e:
-                logger.warning(f"Invalid archive file, creating new one: {e}")
+                logger.warning("Invalid archive file, creating new one: %s", e)
                 self.data = {
                     "processed": {},
                     "failed": {},
@@ -58,7 +74,7 @@ class Archive:
                     },
                 }
         else:
-            logger.info(f"Creating new archive: {self.archive_path}")
+            logger.info("Creating new archive: %s", self.archive_path)
             self.data = {
                 "processed": {},
                 "failed": {},
@@ -70,12 +86,20 @@ class Archive:
             }
             self._save()
 
+        # get_processed_ids snapshot; mark_processed drops it
+        self._processed_ids: Optional[FrozenSet[str]] = None
+
     def _save(self) -> None:
-        """Save archive to file."""
+        """Save archive to file (no-op for in-memory archives)."""
+        if self.archive_path is None:
+            return
+
         try:
-            with open(self.archive_path, "w", encoding="utf-8") as f:
+            with open(
+                self.archive_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+            ) as f:
                 json.dump(self.data, f, indent=2, ensure_ascii=False)
-            logger.debug(f"Archive saved: {self.archive_path}")
+            logger.debug("Archive saved: %s", self.archive_path)
         except Exception as e:
             logger.error(f"Failed to save archive: {e}")
             raise
@@ -108,19 +132,21 @@ class Archive:
             output_path: Path to generated markdown file
             failed_chapters: Number of failed translation chapters
         """
+        now = datetime.now().isoformat()
         self.data["processed"][video_id] = {
             "title": title,
             "output_path": output_path,
-            "processed_at": datetime.now().isoformat(),
+            "processed_at": now,
             "failed_chapters": failed_chapters,
         }
+        self._processed_ids = None
 
         # Update stats
         self.data["stats"]["total_processed"] = len(self.data["processed"])
-        self.data["stats"]["last_update"] = datetime.now().isoformat()
+        self.data["stats"]["last_update"] = now
 
         self._save()
-        logger.info(f"Video marked as processed: {video_id} ({title})")
+        logger.info("Video marked as processed: %s (%s)", video_id, title)
 
     def mark_failed(
         self, video_id: str, title: str, error: str, channel: Optional[str] = None
@@ -134,19 +160,20 @@ class Archive:
             error: Error message
             channel: Channel name (optional)
         """
+        now = datetime.now().isoformat()
         self.data["failed"][video_id] = {
             "title": title,
             "error": error,
             "channel": channel,
-            "failed_at": datetime.now().isoformat(),
+            "failed_at": now,
         }
 
         # Update stats
         self.data["stats"]["total_failed"] = len(self.data["failed"])
-        self.data["stats"]["last_update"] = datetime.now().isoformat()
+        self.data["stats"]["last_update"] = now
 
         self._save()
-        logger.warning(f"Video marked as failed: {video_id} ({title}): {error}")
+        logger.warning("Video marked as failed: %s (%s): %s", video_id, title, error)
 
     def get_processed_videos(self) -> Dict[str, Dict]:
         """
@@ -166,14 +193,52 @@ class Archive:
         """
         return self.data["failed"]
 
-    def get_processed_ids(self) -> Set[str]:
+    def get_processed_ids(self) -> FrozenSet[str]:
         """
         Get set of all processed video IDs.
 
+        The frozen set is built once and reused until the next
+        mark_processed call.
+
+        Returns:
+            Frozen snapshot of video IDs; later changes are not reflected
+        """
+        if self._processed_ids is None:
+            self._processed_ids = frozenset(self.data["processed"])
+        return self._processed_ids
+
+    @staticmethod
+    def load_processed_ids(archive_path: str) -> Set[str]:
+        """
+        Read only the processed video IDs from an archive file.
+
+        Streams the file with ijson when available so per-video records
+        are never built; otherwise falls back to a full JSON load.
+
+        Args:
+            archive_path: Path to archive JSON file
+
         Returns:
-            Set of video IDs
+            Set of video IDs (empty if file is missing or invalid)
         """
-        return set(self.data["processed"].keys())
+        if not os.path.exists(archive_path):
+            return set()
+
+        try:
+            if HAS_IJSON:
+                with open(archive_path, "rb") as f:
+                    return {
+                        value
+                        for prefix, event, value in ijson.parse(f)
+                        if (prefix == "processed" and event == "map_key")
+                        or (prefix == "processed.item" and event == "string")
+                    }
+
+            with open(archive_path, "r", encoding="utf-8") as f:
+                return set(json.load(f).get("processed", {}))
+        except Exception as e:
+            logger.warning("Invalid archive file %s: %s", archive_path, e)
+            return set()
 
     def get_stats(self) -> Dict:
         """
@@ -198,7 +263,7 @@ class Archive:
         if video_id:
             if video_id in self.data["failed"]:
                 del self.data["failed"][video_id]
-                logger.info(f"Cleared failed video: {video_id}")
+                logger.info("Cleared failed video: %s", video_id)
         else:
             self.data["failed"] = {}
             logger.info("Cleared all failed videos")
@@ -220,7 +285,7 @@ class Archive:
             del self.data["failed"][video_id]
             self.data["stats"]["total_failed"] = len(self.data["failed"])
             self._save()
-            logger.info(f"Video moved to retry queue: {video_id}")
+            logger.info("Video moved to retry queue: %s", video_id)
             return True
         return False
 
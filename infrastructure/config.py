@@ -1,6 +1,7 @@
 """Configuration management for YouTube Monitor & Translator system."""
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import List, Dict, Any, Optional
 import json
 import os
@@ -74,42 +75,35 @@ class Config:
     review_enabled: bool
     review_remove_ai_garbage: bool
 
-    # Channel list
-    channels: List[ChannelConfig]
+    # Channel list (parsed from this file on first access)
+    channels_path: str = "channels.json"
 
+    @cached_property
+    def channels(self) -> List[ChannelConfig]:
+        """
+        Channel list, loaded from channels_path on first access and cached.
 
-def load_config(
-    config_path: str = "config_ai.json", channels_path: str = "channels.json"
-) -> Config:
+        Raises:
+            FileNotFoundError: If channels file not found
+            json.JSONDecodeError: If JSON is invalid
+        """
+        return _load_channels(self.channels_path)
+
+
+def _load_channels(channels_path: str) -> List[ChannelConfig]:
     """
-    Load configuration from JSON files.
+    Load and parse channel list from JSON file.
 
     Args:
-        config_path: Path to config_ai.json
         channels_path: Path to channels.json
 
     Returns:
-        Config object with all settings
+        List of valid ChannelConfig entries
 
     Raises:
-        FileNotFoundError: If config files not found
+        FileNotFoundError: If channels file not found
         json.JSONDecodeError: If JSON is invalid
-        ValueError: If required fields are missing
     """
-    logger.debug(f"Loading config from {config_path}")
-
-    # Load main configuration
-    try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config_data = json.load(f)
-    except FileNotFoundError:
-        logger.error(f"Config file not found: {config_path}")
-        raise
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in {config_path}: {e}")
-        raise
-
-    # Load channels configuration
     try:
         with open(channels_path, "r", encoding="utf-8") as f:
             channels_data = json.load(f)
@@ -120,7 +114,6 @@ def load_config(
         logger.error(f"Invalid JSON in {channels_path}: {e}")
         raise
 
-    # Parse channels
     channels = []
     for ch in channels_data.get("channels", []):
         try:
@@ -134,12 +127,52 @@ def load_config(
                 )
             )
         except KeyError as e:
-            logger.warning(f"Skipping invalid channel config: missing {e}")
+            logger.warning("Skipping invalid channel config: missing %s", e)
             continue
 
     if not channels:
         logger.warning("No valid channels found in channels.json")
 
+    logger.debug("Channels loaded: %s from %s", len(channels), channels_path)
+    return channels
+
+
+def load_config(
+    config_path: str = "config_ai.json", channels_path: str = "channels.json"
+) -> Config:
+    """
+    Load configuration from JSON files.
+
+    Only config_path is parsed here. channels_path is stored on the
+    Config and read the first time ``config.channels`` is accessed, so a
+    missing or invalid channels file raises from that access (or from
+    validate_config), not from load_config.
+
+    Args:
+        config_path: Path to config_ai.json
+        channels_path: Path to channels.json
+
+    Returns:
+        Config object with all settings
+
+    Raises:
+        FileNotFoundError: If config file not found
+        json.JSONDecodeError: If config JSON is invalid
+        ValueError: If required fields are missing
+    """
+    logger.debug("Loading config from %s", config_path)
+
+    # Load main configuration
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            config_data = json.load(f)
+    except FileNotFoundError:
+        logger.error(f"Config file not found: {config_path}")
+        raise
+    except json.JSONDecodeError as e:
+        logger.error(f"Invalid JSON in {config_path}: {e}")
+        raise
+
     # Create Config object
     try:
         config = Config(
@@ -165,13 +198,12 @@ def load_config(
             agent_name=config_data.get("agent_name", "tech-investment-analyst"),
             review_enabled=config_data.get("review_enabled", False),
             review_remove_ai_garbage=config_data.get("review_remove_ai_garbage", False),
-            channels=channels,
+            channels_path=channels_path,
         )
 
         logger.info(
-            f"Config loaded: {len(channels)} channels, "
-            f"model={config.claude_model}, "
-            f"use_agent={config.use_agent}"
+            "Config loaded: model=%s, use_agent=%s",
+            config.claude_model, config.use_agent,
         )
         return config
 
@@ -7,15 +7,10 @@ Based on working implementation from /home/sunj11/youtube_monitor/email_sender.p
 """
 
 import os
+import functools
 import logging
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email.mime.text import MIMEText
-from email.utils import formatdate
-from email import encoders
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional
 from dataclasses import dataclass
 
 try:
@@ -24,8 +19,57 @@ try:
 except ImportError:
     HAS_MARKDOWN = False
 
+if TYPE_CHECKING:
+    from email.mime.multipart import MIMEMultipart
+
 logger = logging.getLogger(__name__)
 
+# Static scaffolding of the newsletter email, built once at import
+_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<style>
+body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; max-width: 900px; margin: 0 auto; padding: 20px; background: #fff; }
+h1, h2, h3, h4 { color: #333; }
+h1 { border-bottom: 2px solid #333; padding-bottom: 10px; }
+h2 { border-bottom: 1px solid #ddd; padding-bottom: 5px; margin-top: 0; }
+h3 { color: #555; }
+table { border-collapse: collapse; width: 100%; margin: 10px 0; }
+th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+th { background-color: #f5f5f5; }
+blockquote { border-left: 4px solid #4CAF50; margin: 10px 0; padding-left: 15px; color: #666; background: #f9f9f9; }
+code { background: #f5f5f5; padding: 2px 5px; border-radius: 3px; }
+pre { background: #f5f5f5; padding: 10px; border-radius: 5px; overflow-x: auto; }
+hr { border: none; border-top: 1px solid #ddd; margin: 20px 0; }
+.header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
+.header h1 { color: white; border-bottom: none; }
+.header p { margin: 5px 0; opacity: 0.9; }
+.toc-section { background: #f8f9fa; padding: 20px; border-radius: 8px; margin-bottom: 30px; border: 1px solid #e0e0e0; }
+.toc-section h2 { color: #333; margin-top: 0; }
+.toc-item { margin-bottom: 15px; padding-bottom: 15px; border-bottom: 1px solid #e0e0e0; }
+.toc-item:last-child { border-bottom: none; margin-bottom: 0; padding-bottom: 0; }
+.toc-item a { color: #1a73e8; text-decoration: none; font-weight: 500; font-size: 16px; }
+.toc-item a:hover { text-decoration: underline; }
+.toc-summary { color: #666; font-size: 13px; margin: 8px 0 0 0; line-height: 1.5; }
+.video-section { margin-bottom: 30px; padding: 20px; border: 1px solid #e0e0e0; border-radius: 8px; background: #fff; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+.video-meta { background: #f8f9fa; padding: 10px 15px; border-radius: 5px; margin-bottom: 15px; }
+.video-meta a { color: #1a73e8; text-decoration: none; }
+.video-meta a:hover { text-decoration: underline; }
+.channel-badge { display: inline-block; background: #e3f2fd; color: #1565c0; padding: 3px 10px; border-radius: 15px; font-size: 12px; margin-right: 10px; }
+.divider { margin: 40px 0; padding: 20px 0 0 0; border-top: 2px solid #ddd; text-align: center; color: #999; font-size: 12px; }
+</style>
+</head>
+<body>
+"""
+
+_HTML_TAIL = """
+<hr>
+<p style="color: #666; font-size: 12px; text-align: center;">--- 由 YouTube AI Pipeline 自动生成 ---</p>
+</body>
+</html>
+"""
+
 
 def _extract_video_summary(file_path: str) -> dict:
     """
@@ -94,7 +138,7 @@ def _extract_video_summary(file_path: str) -> dict:
         return summary
 
     except Exception as e:
-        logger.debug(f"提取摘要失败 {file_path}: {e}")
+        logger.debug("提取摘要失败 %s: %s", file_path, e)
         return summary
 
 
@@ -114,6 +158,12 @@ def send_update_email(video_infos: list) -> bool:
         # 动态导入配置以支持热加载
         import email_config
 
+        # smtplib/email 只在真正发信时才导入，避免拖慢模块加载
+        import smtplib
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+        from email.utils import formatdate
+
         if not email_config.MAIL_ENABLE:
             logger.info("📧 邮件发送已禁用")
             return False
@@ -150,9 +200,9 @@ def send_update_email(video_infos: list) -> bool:
                 _attach_file(msg, file_path)
 
         # 发送邮件
-        logger.info(f"\n{'='*60}")
-        logger.info(f"📧 发送邮件到: {', '.join(receivers)}")
-        logger.info(f"   视频数: {len(video_infos)} 个")
+        logger.info("\n%s", '='*60)
+        logger.info("📧 发送邮件到: %s", ', '.join(receivers))
+        logger.info("   视频数: %s 个", len(video_infos))
 
         server = smtplib.SMTP(email_config.SMTP_SERVER, email_config.SMTP_PORT)
         server.starttls()
@@ -160,8 +210,8 @@ def send_update_email(video_infos: list) -> bool:
         server.sendmail(email_config.EMAIL_SENDER, receivers, msg.as_string())
         server.quit()
 
-        logger.info(f"✅ 邮件发送成功")
-        logger.info(f"{'='*60}\n")
+        logger.info("✅ 邮件发送成功")
+        logger.info("%s\n", '='*60)
         return True
 
     except FileNotFoundError:
@@ -184,48 +234,14 @@ def _generate_html_body(video_infos: list) -> str:
     Returns:
         HTML 格式的邮件正文
     """
-    html = """<!DOCTYPE html>
-<html>
-<head>
-<meta charset="utf-8">
-<style>
-body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; max-width: 900px; margin: 0 auto; padding: 20px; background: #fff; }
-h1, h2, h3, h4 { color: #333; }
-h1 { border-bottom: 2px solid #333; padding-bottom: 10px; }
-h2 { border-bottom: 1px solid #ddd; padding-bottom: 5px; margin-top: 0; }
-h3 { color: #555; }
-table { border-collapse: collapse; width: 100%; margin: 10px 0; }
-th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
-th { background-color: #f5f5f5; }
-blockquote { border-left: 4px solid #4CAF50; margin: 10px 0; padding-left: 15px; color: #666; background: #f9f9f9; }
-code { background: #f5f5f5; padding: 2px 5px; border-radius: 3px; }
-pre { background: #f5f5f5; padding: 10px; border-radius: 5px; overflow-x: auto; }
-hr { border: none; border-top: 1px solid #ddd; margin: 20px 0; }
-.header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
-.header h1 { color: white; border-bottom: none; }
-.header p { margin: 5px 0; opacity: 0.9; }
-.toc-section { background: #f8f9fa; padding: 20px; border-radius: 8px; margin-bottom: 30px; border: 1px solid #e0e0e0; }
-.toc-section h2 { color: #333; margin-top: 0; }
-.toc-item { margin-bottom: 15px; padding-bottom: 15px; border-bottom: 1px solid #e0e0e0; }
-.toc-item:last-child { border-bottom: none; margin-bottom: 0; padding-bottom: 0; }
-.toc-item a { color: #1a73e8; text-decoration: none; font-weight: 500; font-size: 16px; }
-.toc-item a:hover { text-decoration: underline; }
-.toc-summary { color: #666; font-size: 13px; margin: 8px 0 0 0; line-height: 1.5; }
-.video-section { margin-bottom: 30px; padding: 20px; border: 1px solid #e0e0e0; border-radius: 8px; background: #fff; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-.video-meta { background: #f8f9fa; padding: 10px 15px; border-radius: 5px; margin-bottom: 15px; }
-.video-meta a { color: #1a73e8; text-decoration: none; }
-.video-meta a:hover { text-decoration: underline; }
-.channel-badge { display: inline-block; background: #e3f2fd; color: #1565c0; padding: 3px 10px; border-radius: 15px; font-size: 12px; margin-right: 10px; }
-.divider { margin: 40px 0; padding: 20px 0 0 0; border-top: 2px solid #ddd; text-align: center; color: #999; font-size: 12px; }
-</style>
-</head>
-<body>
-<div class="header">
-<h1>📺 YouTube AI 摘要/翻译更新</h1>
-<p>更新时间: """ + datetime.now().strftime('%Y-%m-%d %H:%M:%S') + f"""</p>
-<p>处理视频数: {len(video_infos)} 个</p>
-</div>
-"""
+    parts = [
+        _HTML_HEAD,
+        '<div class="header">\n',
+        '<h1>📺 YouTube AI 摘要/翻译更新</h1>\n',
+        f"<p>更新时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>\n",
+        f'<p>处理视频数: {len(video_infos)} 个</p>\n',
+        '</div>\n',
+    ]
 
     # 第一阶段：收集所有视频信息并生成目录
     parsed_videos = []
@@ -257,32 +273,32 @@ hr { border: none; border-top: 1px solid #ddd; margin: 20px 0; }
         })
 
     # 生成目录 (TOC)
-    html += '<div class="toc-section">\n'
-    html += '<h2>📬 目录导航</h2>\n'
+    parts.append('<div class="toc-section">\n')
+    parts.append('<h2>📬 目录导航</h2>\n')
     for video in parsed_videos:
-        html += '<div class="toc-item">\n'
-        html += f'<span class="channel-badge">📢 {video["channel"]}</span>\n'
-        html += f'<a href="#video-{video["index"]}">[{video["index"]}] {video["title"]}</a>\n'
+        parts.append('<div class="toc-item">\n')
+        parts.append(f'<span class="channel-badge">📢 {video["channel"]}</span>\n')
+        parts.append(f'<a href="#video-{video["index"]}">[{video["index"]}] {video["title"]}</a>\n')
         if video['tldr'] and video['tldr'] != '暂无摘要':
-            html += f'<p class="toc-summary">{video["tldr"]}</p>\n'
-        html += '</div>\n'
-    html += '</div>\n'
+            parts.append(f'<p class="toc-summary">{video["tldr"]}</p>\n')
+        parts.append('</div>\n')
+    parts.append('</div>\n')
 
     # 第二阶段：生成详细内容
-    html += '<div class="divider">📋 详细内容</div>\n'
+    parts.append('<div class="divider">📋 详细内容</div>\n')
 
     for video in parsed_videos:
-        html += f'<div class="video-section" id="video-{video["index"]}">\n'
-        html += f'<h2>📺 [{video["index"]}] {video["title"]}</h2>\n'
+        parts.append(f'<div class="video-section" id="video-{video["index"]}">\n')
+        parts.append(f'<h2>📺 [{video["index"]}] {video["title"]}</h2>\n')
 
         # 视频元信息
-        html += '<div class="video-meta">\n'
-        html += f'<span class="channel-badge">📢 {video["channel"]}</span>\n'
+        parts.append('<div class="video-meta">\n')
+        parts.append(f'<span class="channel-badge">📢 {video["channel"]}</span>\n')
         if video['url']:
-            html += f'<a href="{video["url"]}" target="_blank">🔗 观看原视频</a>\n'
+            parts.append(f'<a href="{video["url"]}" target="_blank">🔗 观看原视频</a>\n')
         if video['original_link']:
-            html += f'<a href="{video["original_link"]}" target="_blank">🔗 原始链接</a>\n'
-        html += '</div>\n'
+            parts.append(f'<a href="{video["original_link"]}" target="_blank">🔗 原始链接</a>\n')
+        parts.append('</div>\n')
 
         if video['file_path'] and os.path.exists(video['file_path']):
             try:
@@ -298,24 +314,19 @@ hr { border: none; border-top: 1px solid #ddd; margin: 20px 0; }
                 else:
                     html_content = f'<pre style="white-space: pre-wrap;">{md_content}</pre>'
 
-                html += html_content
+                parts.append(html_content)
             except Exception as e:
-                html += f'<p style="color: red;">[读取文件失败: {e}]</p>'
+                parts.append(f'<p style="color: red;">[读取文件失败: {e}]</p>')
         else:
-            html += f'<p style="color: orange;">[文件不存在: {video["file_path"]}]</p>'
+            parts.append(f'<p style="color: orange;">[文件不存在: {video["file_path"]}]</p>')
 
-        html += '</div>\n'
+        parts.append('</div>\n')
 
-    html += """
-<hr>
-<p style="color: #666; font-size: 12px; text-align: center;">--- 由 YouTube AI Pipeline 自动生成 ---</p>
-</body>
-</html>
-"""
-    return html
+    parts.append(_HTML_TAIL)
+    return ''.join(parts)
 
 
-def _attach_file(msg: MIMEMultipart, file_path: str):
+def _attach_file(msg: "MIMEMultipart", file_path: str):
     """
     将文件作为附件添加到邮件
 
@@ -323,6 +334,9 @@ def _attach_file(msg: MIMEMultipart, file_path: str):
         msg: 邮件对象
         file_path: 文件路径
     """
+    from email import encoders
+    from email.mime.base import MIMEBase
+
     try:
         with open(file_path, 'rb') as attachment:
             part = MIMEBase('application', 'octet-stream')
@@ -336,7 +350,7 @@ def _attach_file(msg: MIMEMultipart, file_path: str):
         part.add_header('Content-Disposition', f'attachment; filename= {filename}')
 
         msg.attach(part)
-        logger.debug(f"   ✓ 附加文件: {filename}")
+        logger.debug("   ✓ 附加文件: %s", filename)
 
     except Exception as e:
         logger.error(f"   ✗ 附加文件失败 {file_path}: {e}")
@@ -344,17 +358,33 @@ def _attach_file(msg: MIMEMultipart, file_path: str):
 
 # Compatibility functions for the new system
 
-def load_email_config():
-    """Load email configuration from email_config.py."""
-    @dataclass
-    class EmailConfig:
-        enabled: bool
-        smtp_server: str
-        smtp_port: int
-        sender_email: str
-        sender_password: str
-        recipient_email: str
+@dataclass(frozen=True)
+class EmailConfig:
+    """Email settings loaded from email_config.py."""
+    enabled: bool
+    smtp_server: str
+    smtp_port: int
+    sender_email: str
+    sender_password: str
+    recipient_email: str
+
+
+@dataclass
+class NotificationResult:
+    """Outcome of send_notification."""
+    success: bool
+    message: str
 
+
+@functools.lru_cache(maxsize=1)
+def load_email_config() -> EmailConfig:
+    """
+    Load email configuration from email_config.py.
+
+    The result is cached for the life of the process (a missing
+    email_config module would otherwise be searched for on every call);
+    use load_email_config.cache_clear() to pick up edits.
+    """
     try:
         import email_config
         return EmailConfig(
@@ -376,7 +406,7 @@ def load_email_config():
         )
 
 
-def send_notification(email_config, video_infos: List[Dict]) -> object:
+def send_notification(email_config, video_infos: List[Dict]) -> NotificationResult:
     """
     Send notification using EmailConfig object.
 
@@ -385,13 +415,8 @@ def send_notification(email_config, video_infos: List[Dict]) -> object:
         video_infos: List of video info dicts
 
     Returns:
-        NotificationResult-like object
+        NotificationResult
     """
-    @dataclass
-    class NotificationResult:
-        success: bool
-        message: str
-
     if not email_config.enabled or not video_infos:
         return NotificationResult(success=False, message="Email disabled or no videos")
 
@@ -1,6 +1,7 @@
 """Tests for infrastructure modules (config, logger, archive)."""
 
 import pytest
+import ast
 import json
 import os
 import tempfile
@@ -118,6 +119,40 @@ class TestConfig:
             with pytest.raises(json.JSONDecodeError):
                 load_config(config_path, config_path)
 
+    def test_channels_loaded_on_first_access(self, temp_config_files):
+        """Test channels.json is read on first access, not by load_config."""
+        config_path, channels_path = temp_config_files
+
+        config = load_config(config_path, channels_path)
+        assert "channels" not in vars(config)
+
+        # Edits before the first access are picked up
+        with open(channels_path, "w", encoding="utf-8") as f:
+            json.dump({"channels": [{"name": "Late", "handle": "@late",
+                                     "url": "https://youtube.com/@late",
+                                     "channel_id": "UClate"}]}, f)
+        assert [ch.name for ch in config.channels] == ["Late"]
+
+        # Later edits are not: the list is cached on the instance
+        os.remove(channels_path)
+        assert [ch.name for ch in config.channels] == ["Late"]
+
+    def test_bad_channels_path(self, temp_config_files):
+        """Test a bad channels_path raises on access, not from load_config."""
+        config_path, channels_path = temp_config_files
+
+        config = load_config(config_path, "/nonexistent/channels.json")
+        with pytest.raises(FileNotFoundError):
+            config.channels
+        with pytest.raises(FileNotFoundError):
+            validate_config(config)
+
+        with open(channels_path, "w") as f:
+            f.write("invalid json {")
+        config = load_config(config_path, channels_path)
+        with pytest.raises(json.JSONDecodeError):
+            config.channels
+
     def test_load_config_missing_field(self, temp_config_files):
         """Test loading config with missing required field."""
         config_path, channels_path = temp_config_files
@@ -141,32 +176,21 @@ class TestConfig:
 
         assert validate_config(config) is True
 
-    def test_validate_config_invalid_durations(self, temp_config_files):
-        """Test validation of invalid chapter durations."""
-        config_path, channels_path = temp_config_files
-        config = load_config(config_path, channels_path)
-
-        config.max_chapter_duration = config.min_chapter_duration - 1
-
-        with pytest.raises(ValueError):
-            validate_config(config)
-
-    def test_validate_config_negative_hours(self, temp_config_files):
-        """Test validation of negative hours."""
-        config_path, channels_path = temp_config_files
-        config = load_config(config_path, channels_path)
-
-        config.lookback_hours = -1
-
-        with pytest.raises(ValueError):
-            validate_config(config)
-
-    def test_validate_config_no_channels(self, temp_config_files):
-        """Test validation with no channels."""
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda c: setattr(c, "max_chapter_duration", c.min_chapter_duration - 1),
+            lambda c: setattr(c, "lookback_hours", -1),
+            lambda c: setattr(c, "channels", []),
+        ],
+        ids=["invalid_durations", "negative_hours", "no_channels"],
+    )
+    def test_validate_config_invalid(self, temp_config_files, mutate):
+        """Test validation rejects invalid durations, hours and channels."""
         config_path, channels_path = temp_config_files
         config = load_config(config_path, channels_path)
 
-        config.channels = []
+        mutate(config)
 
         with pytest.raises(ValueError):
             validate_config(config)
@@ -225,99 +249,183 @@ class TestLogger:
             root_logger = logging.getLogger()
             assert len(root_logger.handlers) > 0
 
+    def test_no_fstring_logging(self, project_root):
+        """Test that log calls use lazy %-formatting, with no f-string in the message or arguments."""
+        offenders = []
+
+        for package in ("core", "infrastructure"):
+            for path in sorted(Path(project_root, package).glob("*.py")):
+                tree = ast.parse(path.read_text(encoding="utf-8"))
+                for node in ast.walk(tree):
+                    if not (
+                        isinstance(node, ast.Call)
+                        and isinstance(node.func, ast.Attribute)
+                        and node.func.attr in ("debug", "info", "warning")
+                        and isinstance(node.func.value, ast.Name)
+                        and node.func.value.id == "logger"
+                    ):
+                        continue
+                    # Any f-string in the call, including inside a conditional argument
+                    if any(
+                        isinstance(sub, ast.JoinedStr)
+                        for arg in node.args
+                        for sub in ast.walk(arg)
+                    ):
+                        offenders.append(f"{package}/{path.name}:{node.lineno}")
+
+        assert offenders == []
+
 
 class TestArchive:
     """Test archive management."""
 
     @pytest.fixture
-    def temp_archive(self):
-        """Create temporary archive for testing."""
+    def in_memory_archive(self):
+        """Create in-memory archive for testing."""
+        return Archive(None)
+
+    @pytest.fixture
+    def disk_archive(self):
+        """Create temporary on-disk archive for testing."""
         with tempfile.TemporaryDirectory() as tmpdir:
             archive_path = os.path.join(tmpdir, "archive.json")
             archive = Archive(archive_path)
             yield archive
 
-    def test_archive_creation(self, temp_archive):
+    def test_archive_creation(self, disk_archive):
         """Test creating new archive."""
-        assert os.path.exists(temp_archive.archive_path)
-        assert temp_archive.data is not None
-        assert "processed" in temp_archive.data
-        assert "failed" in temp_archive.data
-        assert "stats" in temp_archive.data
+        assert os.path.exists(disk_archive.archive_path)
+        assert disk_archive.data is not None
+        assert "processed" in disk_archive.data
+        assert "failed" in disk_archive.data
+        assert "stats" in disk_archive.data
+
+    def test_archive_in_memory(self, in_memory_archive):
+        """Test that an in-memory archive works without a file."""
+        in_memory_archive.mark_processed("vid1", "Video 1", "/path/1.md")
+
+        assert in_memory_archive.archive_path is None
+        assert in_memory_archive.is_processed("vid1")
 
-    def test_mark_processed(self, temp_archive):
+    def test_mark_processed(self, in_memory_archive):
         """Test marking video as processed."""
-        temp_archive.mark_processed(
+        in_memory_archive.mark_processed(
             "vid123", "Test Video", "/path/to/output.md", failed_chapters=0
         )
 
-        assert temp_archive.is_processed("vid123")
-        processed = temp_archive.get_processed_videos()
+        assert in_memory_archive.is_processed("vid123")
+        processed = in_memory_archive.get_processed_videos()
         assert "vid123" in processed
         assert processed["vid123"]["title"] == "Test Video"
 
-    def test_mark_failed(self, temp_archive):
+    def test_mark_failed(self, in_memory_archive):
         """Test marking video as failed."""
-        temp_archive.mark_failed("vid456", "Failed Video", "Test error")
+        in_memory_archive.mark_failed("vid456", "Failed Video", "Test error")
 
-        failed = temp_archive.get_failed_videos()
+        failed = in_memory_archive.get_failed_videos()
         assert "vid456" in failed
         assert failed["vid456"]["title"] == "Failed Video"
         assert failed["vid456"]["error"] == "Test error"
 
-    def test_get_processed_ids(self, temp_archive):
+    def test_get_processed_ids(self, in_memory_archive):
         """Test getting set of processed video IDs."""
-        temp_archive.mark_processed("vid1", "Video 1", "/path/1.md")
-        temp_archive.mark_processed("vid2", "Video 2", "/path/2.md")
+        in_memory_archive.mark_processed("vid1", "Video 1", "/path/1.md")
+        in_memory_archive.mark_processed("vid2", "Video 2", "/path/2.md")
 
-        ids = temp_archive.get_processed_ids()
+        ids = in_memory_archive.get_processed_ids()
         assert "vid1" in ids
         assert "vid2" in ids
         assert len(ids) == 2
 
-    def test_get_stats(self, temp_archive):
+    def test_get_processed_ids_is_snapshot(self, in_memory_archive):
+        """Test the returned IDs cannot change the archive's index."""
+        in_memory_archive.mark_processed("vid1", "Video 1", "/path/1.md")
+
+        ids = in_memory_archive.get_processed_ids()
+        with pytest.raises(AttributeError):
+            ids.add("vid2")
+        assert not in_memory_archive.is_processed("vid2")
+
+        in_memory_archive.mark_processed("vid3", "Video 3", "/path/3.md")
+        assert ids == {"vid1"}
+        assert in_memory_archive.get_processed_ids() == {"vid1", "vid3"}
+
+    def test_get_processed_ids_after_writes(self, in_memory_archive):
+        """Test the snapshot is reused until a mark, and failed-list removals leave it alone."""
+        archive = in_memory_archive
+        archive.mark_processed("vid1", "Video 1", "/path/1.md")
+        first = archive.get_processed_ids()
+        assert archive.get_processed_ids() is first
+
+        archive.mark_failed("bad1", "Bad 1", "error")
+        archive.mark_failed("bad2", "Bad 2", "error")
+        archive.retry_failed("bad1")
+        archive.clear_failed()
+        assert archive.get_processed_ids() == {"vid1"}
+
+        archive.mark_processed("vid2", "Video 2", "/path/2.md")
+        archive.mark_processed("vid1", "Video 1 again", "/path/1b.md")
+        second = archive.get_processed_ids()
+        assert second == {"vid1", "vid2"}
+        assert first == {"vid1"}
+        assert archive.is_processed("vid2") and not archive.is_processed("bad2")
+
+    def test_load_processed_ids(self, disk_archive):
+        """Test reading processed IDs straight from the archive file."""
+        disk_archive.mark_processed("vid1", "Video 1", "/path/1.md")
+        disk_archive.mark_processed("vid2", "Video 2", "/path/2.md")
+        disk_archive.mark_failed("vid3", "Video 3", "error")
+
+        ids = Archive.load_processed_ids(disk_archive.archive_path)
+        assert ids == {"vid1", "vid2"}
+
+    def test_load_processed_ids_missing_file(self):
+        """Test reading processed IDs from a missing archive file."""
+        assert Archive.load_processed_ids("/nonexistent/archive.json") == set()
+
+    def test_get_stats(self, in_memory_archive):
         """Test getting archive statistics."""
-        temp_archive.mark_processed("vid1", "Video 1", "/path/1.md")
-        temp_archive.mark_failed("vid2", "Video 2", "error")
+        in_memory_archive.mark_processed("vid1", "Video 1", "/path/1.md")
+        in_memory_archive.mark_failed("vid2", "Video 2", "error")
 
-        stats = temp_archive.get_stats()
+        stats = in_memory_archive.get_stats()
         assert stats["total_processed"] == 1
         assert stats["total_failed"] == 1
         assert stats["last_update"] is not None
 
-    def test_clear_failed_all(self, temp_archive):
+    def test_clear_failed_all(self, in_memory_archive):
         """Test clearing all failed videos."""
-        temp_archive.mark_failed("vid1", "Video 1", "error1")
-        temp_archive.mark_failed("vid2", "Video 2", "error2")
+        in_memory_archive.mark_failed("vid1", "Video 1", "error1")
+        in_memory_archive.mark_failed("vid2", "Video 2", "error2")
 
-        temp_archive.clear_failed()
+        in_memory_archive.clear_failed()
 
-        failed = temp_archive.get_failed_videos()
+        failed = in_memory_archive.get_failed_videos()
         assert len(failed) == 0
 
-    def test_clear_failed_specific(self, temp_archive):
+    def test_clear_failed_specific(self, in_memory_archive):
         """Test clearing specific failed video."""
-        temp_archive.mark_failed("vid1", "Video 1", "error1")
-        temp_archive.mark_failed("vid2", "Video 2", "error2")
+        in_memory_archive.mark_failed("vid1", "Video 1", "error1")
+        in_memory_archive.mark_failed("vid2", "Video 2", "error2")
 
-        temp_archive.clear_failed("vid1")
+        in_memory_archive.clear_failed("vid1")
 
-        failed = temp_archive.get_failed_videos()
+        failed = in_memory_archive.get_failed_videos()
         assert "vid1" not in failed
         assert "vid2" in failed
 
-    def test_retry_failed(self, temp_archive):
+    def test_retry_failed(self, in_memory_archive):
         """Test moving failed video to retry queue."""
-        temp_archive.mark_failed("vid1", "Video 1", "error")
+        in_memory_archive.mark_failed("vid1", "Video 1", "error")
 
-        assert temp_archive.retry_failed("vid1") is True
+        assert in_memory_archive.retry_failed("vid1") is True
 
-        failed = temp_archive.get_failed_videos()
+        failed = in_memory_archive.get_failed_videos()
         assert "vid1" not in failed
 
-    def test_retry_non_existent_video(self, temp_archive):
+    def test_retry_non_existent_video(self, in_memory_archive):
         """Test retrying non-existent video."""
-        assert temp_archive.retry_failed("nonexistent") is False
+        assert in_memory_archive.retry_failed("nonexistent") is False
 
     def test_archive_persistence(self):
         """Test that archive persists to disk."""
@@ -335,12 +443,26 @@ class TestArchive:
             processed = archive2.get_processed_videos()
             assert "vid1" in processed
 
-    def test_export_summary(self, temp_archive):
+    def test_archive_legacy_processed_list(self):
+        """Test loading an archive whose processed entries are an ID list."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            archive_path = os.path.join(tmpdir, "archive.json")
+
+            with open(archive_path, "w", encoding="utf-8") as f:
+                json.dump({"processed": ["vid1", "vid2"]}, f)
+
+            archive = Archive(archive_path)
+
+            assert archive.is_processed("vid1")
+            assert archive.get_processed_ids() == {"vid1", "vid2"}
+            assert Archive.load_processed_ids(archive_path) == {"vid1", "vid2"}
+
+    def test_export_summary(self, in_memory_archive):
         """Test exporting archive summary."""
-        temp_archive.mark_processed("vid1", "Video 1", "/path/1.md")
-        temp_archive.mark_failed("vid2", "Video 2", "error")
+        in_memory_archive.mark_processed("vid1", "Video 1", "/path/1.md")
+        in_memory_archive.mark_failed("vid2", "Video 2", "error")
 
-        summary = temp_archive.export_summary()
+        summary = in_memory_archive.export_summary()
 
         assert "Archive Summary" in summary
         assert "Total Processed: 1" in summary
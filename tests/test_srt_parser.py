@@ -0,0 +1,149 @@
+"""Tests for utils.srt_parser."""
+
+from utils.srt_parser import (
+    SubtitleEntry,
+    SubtitleIndex,
+    get_segment_text,
+    get_text_for_time_range,
+    parse_srt,
+    parse_srt_content,
+)
+
+SRT_TEXT = """1
+00:00:01,000 --> 00:00:04,500
+Hello <i>world</i>
+
+2
+00:01:02,250 --> 00:01:05,000
+Second line
+continues here
+
+3
+01:00:00,000 --> 01:00:02,999
+Last
+"""
+
+EXPECTED_SRT = [
+    (1, 4, "Hello world"),
+    (62, 65, "Second line continues here"),
+    (3600, 3602, "Last"),
+]
+
+
+def _scan_range(entries, start_sec, end_sec, join_with=" "):
+    """Reference overlap scan over the whole list."""
+    return join_with.join(
+        e.text for e in entries if e.start_sec < end_sec and e.end_sec > start_sec
+    )
+
+
+class TestParseSrt:
+    """Test SRT parsing into tuples and SubtitleEntry objects."""
+
+    def test_parse_srt(self):
+        """Test basic blocks, multi-line text and tag stripping."""
+        assert parse_srt(SRT_TEXT) == EXPECTED_SRT
+        assert parse_srt("") == []
+
+    def test_crlf_line_endings(self):
+        """Test Windows line endings parse the same as LF."""
+        crlf = SRT_TEXT.replace("\n", "\r\n")
+
+        assert parse_srt(crlf) == EXPECTED_SRT
+        assert [(e.start_sec, e.end_sec, e.text) for e in parse_srt_content(crlf)] == [
+            (1.0, 4.5, "Hello world"),
+            (62.25, 65.0, "Second line\ncontinues here"),
+            (3600.0, 3602.999, "Last"),
+        ]
+
+    def test_whitespace_only_separator_lines(self):
+        """Test blank lines holding spaces or tabs still end a block."""
+        spaced = SRT_TEXT.replace("\n\n", "\n  \t\n")
+
+        assert parse_srt(spaced) == EXPECTED_SRT
+        assert [e.text for e in parse_srt_content(spaced)] == [
+            "Hello world", "Second line\ncontinues here", "Last",
+        ]
+
+    def test_cue_settings_after_arrow(self):
+        """Test trailing cue settings on the timing line are ignored."""
+        content = (
+            "1\n00:00:01,000 --> 00:00:02,000 align:start position:10%\nCue one\n\n"
+            "2\n00:00:03.500 --> 00:00:04.000  line:0\nCue two\n"
+        )
+
+        assert parse_srt(content) == [(1, 2, "Cue one"), (3, 4, "Cue two")]
+        entries = parse_srt_content(content)
+        assert [(e.index, e.start_sec, e.end_sec, e.text) for e in entries] == [
+            (1, 1.0, 2.0, "Cue one"),
+            (2, 3.5, 4.0, "Cue two"),
+        ]
+
+    def test_malformed_timing_skips_block(self):
+        """Test a block with a bad timing line is dropped, not merged."""
+        content = "1\nnot a timing line\nLost\n\n2\n00:00:05,000 --> 00:00:06,000\nKept\n"
+
+        assert parse_srt(content) == [(5, 6, "Kept")]
+        assert [e.text for e in parse_srt_content(content)] == ["Kept"]
+
+
+class TestSubtitleIndex:
+    """Test range lookups through SubtitleIndex."""
+
+    def test_text_for_time_range(self):
+        """Test indexed lookups against a full scan, sorted and unsorted."""
+        entries = [
+            SubtitleEntry(1, 0.0, 2.0, "a"),
+            SubtitleEntry(2, 1.0, 10.0, "b"),
+            SubtitleEntry(3, 3.0, 4.0, "c"),
+            SubtitleEntry(4, 5.0, 6.0, "d"),
+            SubtitleEntry(5, 6.0, 7.0, "e"),
+        ]
+        shuffled = [entries[3], entries[0], entries[4], entries[2], entries[1]]
+
+        for subtitles in (entries, shuffled):
+            index = SubtitleIndex(subtitles)
+            for start in (0, 0.5, 2, 4, 6, 9.9, 10, 20):
+                for end in (0, 1, 3.5, 6, 7, 100):
+                    expected = _scan_range(subtitles, start, end)
+                    assert get_text_for_time_range(subtitles, start, end) == expected
+                    assert get_text_for_time_range(subtitles, start, end, index=index) == expected
+
+    def test_segment_text(self):
+        """Test chapter text extends past the end to a sentence boundary."""
+        srt_entries = [
+            (0, 2, "Intro."),
+            (5, 8, "This sentence"),
+            (10, 12, "runs on"),
+            (12, 14, "to here."),
+            (15, 18, "Next chapter."),
+        ]
+        index = SubtitleIndex(srt_entries)
+
+        for kwargs in ({}, {"index": index}):
+            assert get_segment_text(srt_entries, 0, 5, **kwargs) == "Intro."
+            assert get_segment_text(srt_entries, 5, 10, **kwargs) == "This sentence\nruns on\nto here."
+            assert get_segment_text(srt_entries, 15, None, **kwargs) == "Next chapter."
+
+    def test_lookup_sees_in_place_edits(self):
+        """Test that calls without an index see edits to the same list."""
+        srt_entries = [(0, 5, "old.")]
+        assert get_segment_text(srt_entries, 0, 10) == "old."
+
+        srt_entries[0] = (0, 5, "new.")
+        assert get_segment_text(srt_entries, 0, 10) == "new."
+
+        entries = [SubtitleEntry(1, 0.0, 5.0, "old")]
+        assert get_text_for_time_range(entries, 0, 10) == "old"
+        entries[0].text = "new"
+        entries.append(SubtitleEntry(2, 5.0, 6.0, "more"))
+        assert get_text_for_time_range(entries, 0, 10) == "new more"
+
+    def test_explicit_index_is_a_snapshot(self):
+        """Test that a passed index keeps the entries it was built from."""
+        srt_entries = [(0, 5, "old.")]
+        index = SubtitleIndex(srt_entries)
+
+        srt_entries[0] = (0, 5, "new.")
+        assert get_segment_text(srt_entries, 0, 10, index=index) == "old."
+        assert get_segment_text(srt_entries, 0, 10, index=SubtitleIndex(srt_entries)) == "new."
@@ -0,0 +1,182 @@
+"""Tests for utils.time_parser."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import utils.time_parser as time_parser
+from utils.time_parser import (
+    filter_recent,
+    format_timestamp,
+    format_timestamps,
+    is_recent,
+    merge_ranges,
+    merge_ranges_arr,
+    overlaps,
+    parse_iso_date,
+    overlaps_batch,
+)
+
+# Sub-hour, hour-boundary, 100h+ and negative (clamped) durations
+FORMAT_CASES = [0, 0.999, 59, 60, 330.0, 3599.9, 3600, 5025.0, 359999, 360000, 3723456.7, -1, -0.5]
+
+
+class TestFormatTimestamps:
+    """Test batch timestamp formatting."""
+
+    def test_matches_format_timestamp(self):
+        """Test the vectorized path against format_timestamp per item."""
+        np = pytest.importorskip("numpy")
+        expected = [format_timestamp(v) for v in FORMAT_CASES]
+
+        assert format_timestamps(FORMAT_CASES) == expected
+        assert format_timestamps(np.array(FORMAT_CASES)) == expected
+        ints = [int(v) for v in FORMAT_CASES]
+        assert format_timestamps(np.array(ints)) == [format_timestamp(v) for v in ints]
+        assert format_timestamps(np.array(FORMAT_CASES, dtype=np.float32)) == [
+            format_timestamp(float(v)) for v in np.array(FORMAT_CASES, dtype=np.float32)
+        ]
+
+    def test_without_numpy(self, monkeypatch):
+        """Test the per-item fallback used when NumPy is missing."""
+        monkeypatch.setattr(time_parser, "HAS_NUMPY", False)
+
+        assert format_timestamps(FORMAT_CASES) == [format_timestamp(v) for v in FORMAT_CASES]
+        assert format_timestamps([360000, -1]) == ["100:00:00", "00:00"]
+
+
+class TestParseIsoDate:
+    """Test date parsing."""
+
+    def test_compact_dates(self):
+        """Test yt-dlp style YYYYMMDD dates."""
+        assert parse_iso_date("20251221") == datetime(2025, 12, 21)
+        assert parse_iso_date(" 20251221 ") == datetime(2025, 12, 21)
+        assert parse_iso_date("20251341") is None
+
+    def test_non_ascii_digits_rejected(self):
+        """Test full-width and other non-ASCII digits do not parse."""
+        assert parse_iso_date("２０２５１２２１") is None
+        assert parse_iso_date("2025１２21") is None
+        assert parse_iso_date("٢٠٢٥١٢٢١") is None
+
+
+class TestRecency:
+    """Test lookback-window checks."""
+
+    def test_filter_recent(self):
+        """Test checking a batch of dates against one window."""
+        today = datetime.now().strftime("%Y-%m-%d")
+        old_date = (datetime.now() - timedelta(days=10)).strftime("%Y-%m-%d")
+
+        assert filter_recent([today, old_date, "not a date"], 24) == [True, False, False]
+        assert filter_recent([], 24) == []
+
+    def test_filter_recent_matches_is_recent(self):
+        """Test that the batch result equals per-item is_recent."""
+        reference = datetime(2025, 12, 22, 12, 0)
+        dates = [
+            "2025-12-22T11:00:00Z",
+            "2025-12-21 12:00:00",
+            "20251220",
+            "2025-12-19",
+            "",
+            "garbage",
+        ]
+
+        expected = [is_recent(d, 48, reference) for d in dates]
+        assert filter_recent(dates, 48, reference) == expected
+        assert expected == [True, True, False, False, False, False]
+
+
+class TestOverlaps:
+    """Test range overlap checks."""
+
+    def test_overlaps(self):
+        """Test the scalar pairwise check, including touching ranges."""
+        assert overlaps(100, 300, 200, 400)
+        assert not overlaps(100, 200, 300, 400)
+        assert not overlaps(100, 200, 200, 300)
+
+    def test_overlaps_batch_matches_overlaps(self):
+        """Test that every cell of the batch result equals overlaps()."""
+        pytest.importorskip("numpy")
+        first = [(0, 10), (5, 15), (20, 30), (30, 40), (-5, 0.5)]
+        second = [(10, 20), (0, 1), (25, 26), (40, 50), (14.5, 20)]
+
+        result = overlaps_batch(
+            [s for s, _ in first], [e for _, e in first],
+            [s for s, _ in second], [e for _, e in second],
+        )
+
+        assert result.shape == (len(first), len(second))
+        expected = [[overlaps(s1, e1, s2, e2) for s2, e2 in second] for s1, e1 in first]
+        assert result.tolist() == expected
+
+    def test_overlaps_batch_without_numpy(self, monkeypatch):
+        """Test the nested overlaps() fallback used when NumPy is missing."""
+        monkeypatch.setattr(time_parser, "HAS_NUMPY", False)
+
+        assert overlaps_batch([100, 500], [300, 600], [200, 0], [400, 100]) == [
+            [True, False],
+            [False, False],
+        ]
+        assert overlaps_batch([], [], [1], [2]) == []
+
+
+class TestMergeRanges:
+    """Test merging overlapping ranges."""
+
+    def test_merge_overlapping(self):
+        """Test merging unsorted, overlapping and touching ranges."""
+        assert merge_ranges([(500, 600), (100, 300), (200, 400)]) == [(100, 400), (500, 600)]
+        assert merge_ranges([(0, 10), (10, 20)]) == [(0, 20)]
+        assert merge_ranges([(0, 50), (10, 20), (30, 40)]) == [(0, 50)]
+
+    def test_merge_edge_cases(self):
+        """Test empty, single and already-disjoint input."""
+        assert merge_ranges([]) == []
+        assert merge_ranges([(1, 2)]) == [(1, 2)]
+        assert merge_ranges([(0, 1), (2, 3), (4, 5)]) == [(0, 1), (2, 3), (4, 5)]
+
+    def test_merge_returns_tuples(self):
+        """Test that list pairs come back as tuples on every path."""
+        assert merge_ranges([[1, 2]]) == [(1, 2)]
+        assert merge_ranges([[0, 1], [2, 3]]) == [(0, 1), (2, 3)]
+        assert merge_ranges([[2, 3], [0, 1]]) == [(0, 1), (2, 3)]
+        assert all(type(r) is tuple for r in merge_ranges([[2, 3], [0, 1], [1, 2]]))
+
+    def test_merge_ranges_arr_matches_merge_ranges(self):
+        """Test the array form against merge_ranges on random input."""
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            n = int(rng.integers(1, 30))
+            starts = rng.integers(0, 100, n).astype(float)
+            ends = starts + rng.choice([0, 0.5, 1, 5, 20], n)
+
+            merged_starts, merged_ends = merge_ranges_arr(starts, ends)
+
+            expected = merge_ranges(list(zip(starts.tolist(), ends.tolist())))
+            assert list(zip(merged_starts.tolist(), merged_ends.tolist())) == expected
+
+    def test_merge_ranges_arr_edge_cases(self):
+        """Test empty input and mismatched shapes."""
+        pytest.importorskip("numpy")
+        merged_starts, merged_ends = merge_ranges_arr([], [])
+        assert merged_starts.size == 0 and merged_ends.size == 0
+
+        with pytest.raises(ValueError):
+            merge_ranges_arr([0, 1], [1])
+
+    def test_merge_ranges_arr_without_numpy(self, monkeypatch):
+        """Test the merge_ranges fallback used when NumPy is missing."""
+        monkeypatch.setattr(time_parser, "HAS_NUMPY", False)
+
+        assert merge_ranges_arr([500, 100, 200], [600, 300, 400]) == (
+            [100.0, 500.0],
+            [400.0, 600.0],
+        )
+        assert merge_ranges_arr([], []) == ([], [])
+        with pytest.raises(ValueError):
+            merge_ranges_arr([0, 1], [1])
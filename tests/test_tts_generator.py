@@ -0,0 +1,208 @@
+"""Tests for tts_tool.tts_generator."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("edge_tts")
+
+from tts_tool import tts_generator
+from tts_tool.tts_generator import _collect_inputs, _split_for_tts, _strip_inline_format
+
+
+class TestInlineFormat:
+    """Test stripping inline Markdown from paragraph text."""
+
+    @pytest.mark.parametrize(
+        "line, expected",
+        [
+            ("**(0:00 - 1:15)** 开场", " 开场"),
+            ("**粗体** *斜体* `代码` [链接](https://x.y)", "粗体 斜体 代码 链接"),
+            ("**[a](u)**", "a"),
+            ("**a `b` c**", "a b c"),
+            ("***x***", "x"),
+            ("[**a**](u)", "a"),
+            ("*`c`*", "c"),
+            ("2 * 3 = 6", "2 * 3 = 6"),
+        ],
+    )
+    def test_strip_inline_format(self, line, expected):
+        """Test flat and nested markup, including nested forms that must be fully removed."""
+        assert _strip_inline_format(line) == expected
+
+    def test_nested_markup_in_extracted_text(self, tmp_path, monkeypatch):
+        """Test nested markup never reaches the extracted text."""
+        monkeypatch.setattr(tts_generator, "_CACHE_DIR", tmp_path / "cache")
+        md = tmp_path / "doc.md"
+        md.write_text("见 **[报告](https://x.y)** 和 ***重点***。\n", encoding="utf-8")
+
+        assert tts_generator.extract_text_from_markdown(str(md)) == "见 报告 和 重点。"
+
+
+class TestSplitForTts:
+    """Test packing text into TTS request chunks."""
+
+    def test_short_text_is_one_chunk(self):
+        """Test text under the limit stays whole."""
+        assert _split_for_tts("第一句。第二句！", 100) == ["第一句。第二句！"]
+        assert _split_for_tts("", 100) == []
+
+    def test_splits_at_sentence_ends(self):
+        """Test chunks break only after sentence punctuation."""
+        text = "One two. Three four? Five six! 七八。 九十"
+
+        chunks = _split_for_tts(text, 21)
+
+        assert chunks == ["One two.\nThree four?", "Five six!\n七八。\n九十"]
+
+    def test_chunks_respect_max_chars(self):
+        """Test every chunk fits the limit and no sentence is lost."""
+        sentences = [f"Sentence number {i} {'x' * (i % 7)}." for i in range(200)]
+        text = " ".join(sentences)
+
+        for max_chars in (30, 64, 500, 2000):
+            chunks = _split_for_tts(text, max_chars)
+            assert all(len(chunk) <= max_chars for chunk in chunks)
+            assert [s for chunk in chunks for s in chunk.split("\n")] == sentences
+
+    def test_long_sentence_gets_own_chunk(self):
+        """Test a sentence over the limit is kept whole in its own chunk."""
+        long_sentence = "y" * 50 + "."
+
+        chunks = _split_for_tts(f"Short. {long_sentence} Tail.", 20)
+
+        assert chunks == ["Short.", long_sentence, "Tail."]
+
+
+class TestExtractCache:
+    """Test the on-disk cache of extracted Markdown text."""
+
+    def test_hit_miss_and_version_bump(self, tmp_path, monkeypatch):
+        """Test cache hits, misses after edits and version bumps, and pruning."""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(tts_generator, "_CACHE_DIR", cache_dir)
+        calls = []
+        real_extract = tts_generator._extract_text_uncached
+
+        def counting_extract(md_path):
+            calls.append(md_path)
+            return real_extract(md_path)
+
+        monkeypatch.setattr(tts_generator, "_extract_text_uncached", counting_extract)
+        md = tmp_path / "doc.md"
+        md.write_text("# Title\n\nFirst body.\n", encoding="utf-8")
+
+        # Miss, then hit
+        first = tts_generator.extract_text_from_markdown(str(md))
+        assert tts_generator.extract_text_from_markdown(str(md)) == first
+        assert len(calls) == 1
+        assert len(list(cache_dir.iterdir())) == 1
+
+        # Editing the file misses and replaces the old entry
+        md.write_text("# Title\n\nSecond, longer body.\n", encoding="utf-8")
+        second = tts_generator.extract_text_from_markdown(str(md))
+        assert "Second, longer body." in second
+        assert len(calls) == 2
+        assert len(list(cache_dir.iterdir())) == 1
+
+        # A version bump misses and replaces the old-version entry
+        monkeypatch.setattr(tts_generator, "_CACHE_VERSION", tts_generator._CACHE_VERSION + 1)
+        assert tts_generator.extract_text_from_markdown(str(md)) == second
+        assert len(calls) == 3
+        entries = list(cache_dir.iterdir())
+        assert len(entries) == 1
+        assert entries[0].name.startswith(f"v{tts_generator._CACHE_VERSION}-")
+
+    def test_other_paths_are_kept(self, tmp_path, monkeypatch):
+        """Test pruning only touches entries for the same file."""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(tts_generator, "_CACHE_DIR", cache_dir)
+        for name in ("a.md", "b.md"):
+            (tmp_path / name).write_text(f"Body of {name}.\n", encoding="utf-8")
+            tts_generator.extract_text_from_markdown(str(tmp_path / name))
+
+        assert len(list(cache_dir.iterdir())) == 2
+
+
+class TestCollectInputs:
+    """Test expanding file, directory and glob arguments."""
+
+    def _make(self, root, *names):
+        """Create small Markdown files under root."""
+        for name in names:
+            path = root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("# t", encoding="utf-8")
+
+    def test_directory_glob_and_literal(self, tmp_path):
+        """Test each input form and the order results come back in."""
+        self._make(tmp_path, "dir/b.md", "dir/a.md", "dir/notes.txt", "g/x1.md", "g/x2.md", "one.md")
+
+        result = _collect_inputs([
+            str(tmp_path / "dir"),
+            str(tmp_path / "g" / "x*.md"),
+            str(tmp_path / "one.md"),
+            str(tmp_path / "missing.md"),
+        ])
+
+        assert result == [
+            tmp_path / "dir" / "a.md",
+            tmp_path / "dir" / "b.md",
+            tmp_path / "g" / "x1.md",
+            tmp_path / "g" / "x2.md",
+            tmp_path / "one.md",
+            # Missing literal paths are kept and reported per file later
+            tmp_path / "missing.md",
+        ]
+
+    def test_same_file_listed_twice(self, tmp_path):
+        """Test a file reached through two inputs is processed once."""
+        self._make(tmp_path, "dir/a.md")
+
+        result = _collect_inputs([str(tmp_path / "dir"), str(tmp_path / "dir" / "a.md")])
+
+        assert result == [tmp_path / "dir" / "a.md"]
+
+    def test_duplicate_stems_rejected(self, tmp_path):
+        """Test different files that would write the same .mp3 are rejected."""
+        self._make(tmp_path, "one/summary.md", "two/summary.md")
+
+        with pytest.raises(ValueError, match="summary"):
+            _collect_inputs([str(tmp_path / "one"), str(tmp_path / "two")])
+
+
+class TestGenerateAudioParallel:
+    """Test chunked audio generation without the network."""
+
+    def test_failure_cancels_sibling_parts(self, monkeypatch):
+        """Test a failing part cancels the others before the temp dir is removed."""
+        events = []
+
+        async def fake_generate_audio(text, output_path, voice=None):
+            if text.startswith("Bad"):
+                await asyncio.sleep(0.01)
+                raise RuntimeError("tts failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                # The part's temp dir must still exist while it unwinds
+                events.append(Path(output_path).parent.exists())
+                raise
+
+        monkeypatch.setattr(tts_generator, "generate_audio", fake_generate_audio)
+        monkeypatch.setattr(
+            tts_generator, "_split_for_tts", lambda text: ["Bad part.", "Slow one.", "Slow two."]
+        )
+
+        async def run():
+            with pytest.raises(RuntimeError, match="tts failed"):
+                await tts_generator.generate_audio_parallel(
+                    "unused", "unused.mp3",
+                    semaphore=asyncio.Semaphore(3),
+                )
+            # Nothing is left running once the call has returned
+            return [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+
+        assert asyncio.run(run()) == []
+        assert events == [True, True]
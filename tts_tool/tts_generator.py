@@ -11,9 +11,17 @@ TTS 语音生成工具
 
 import argparse
 import asyncio
+import glob
+import gzip
+import hashlib
+import io
+import os
 import re
+import shutil
 import sys
+import tempfile
 from pathlib import Path
+from typing import List, Optional
 
 try:
     import edge_tts
@@ -36,6 +44,44 @@ VOICES = {
 
 DEFAULT_VOICE = "zh-CN-YunjianNeural"  # 云健-热情男声
 
+# Markdown 清理用的正则，模块加载时编译一次
+# 段落内格式按顺序逐个去掉：时间戳 **(0:00 - 1:15)** / 加粗 / 斜体 / 代码 / 链接
+# 顺序不能合并成一个正则：嵌套格式（如 **[a](u)**、***x***）要靠前一步剥掉外层后，后一步再处理内层
+_TS_MARK_RE = re.compile(r'\*\*\([\d:]+\s*-\s*[\d:]+\)\*\*')
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_ITALIC_RE = re.compile(r'\*([^*]+)\*')
+_CODE_RE = re.compile(r'`([^`]+)`')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_HEADING_TS_RE = re.compile(r'\([\d:]+\s*-\s*[\d:]+\)\s*')
+
+# 不朗读的章节（标题包含以下任一文字即跳过），合并成一个正则一次匹配
+_SKIP_SECTIONS = frozenset({'📹 视频信息', '📑 章节导航表', '🏢 提及的公司', '📺 视频类型判断'})
+_SKIP_SECTIONS_RE = re.compile('|'.join(map(re.escape, sorted(_SKIP_SECTIONS))))
+
+# 提取结果缓存：按 (路径, mtime, 大小) 命中，每个路径只保留一份，提取逻辑变化时递增 _CACHE_VERSION
+_CACHE_DIR = Path.home() / ".cache" / "tts_tool"
+_CACHE_VERSION = 2
+
+# 分段合成：按句末标点切分，每段不超过 _TTS_CHUNK_CHARS 字符，最多并发 _TTS_CONCURRENCY 路
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[。！？.!?])\s+')
+_TTS_CHUNK_CHARS = 2000
+_TTS_CONCURRENCY = 6
+# Edge TTS 输出为 24kHz 单声道 48kbps MP3，重新编码时保持同样的参数
+_REENCODE_BITRATE = "48k"
+
+
+def _strip_inline_format(text: str) -> str:
+    """去掉段落内的 Markdown 格式；行内没有对应标记字符时跳过那一步替换"""
+    if '*' in text:
+        text = _TS_MARK_RE.sub('', text)
+        text = _BOLD_RE.sub(r'\1', text)
+        text = _ITALIC_RE.sub(r'\1', text)
+    if '`' in text:
+        text = _CODE_RE.sub(r'\1', text)
+    if '[' in text:
+        text = _LINK_RE.sub(r'\1', text)
+    return text
+
 
 def extract_text_from_markdown(md_path: str) -> str:
     """
@@ -45,125 +91,283 @@ def extract_text_from_markdown(md_path: str) -> str:
     - 去掉 Markdown 格式标记
     - 保留章节结构
     - 去掉表格、链接等
+
+    同一文件未修改时直接读取 ~/.cache/tts_tool 中的缓存结果
     """
-    with open(md_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    st = os.stat(md_path)
+    path_hash = hashlib.sha1(os.path.abspath(md_path).encode('utf-8')).hexdigest()[:16]
+    cache_file = _CACHE_DIR / f"v{_CACHE_VERSION}-{path_hash}-{st.st_mtime_ns}-{st.st_size}.txt.gz"
+
+    try:
+        return gzip.decompress(cache_file.read_bytes()).decode('utf-8')
+    except (OSError, EOFError, UnicodeDecodeError):
+        pass
 
-    lines = content.split('\n')
-    result = []
+    text = _extract_text_uncached(md_path)
+
+    # 缓存写入失败（如只读目录）不影响结果
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(gzip.compress(text.encode('utf-8')))
+        # 同一路径只保留最新一份：删除旧版本或文件修改前留下的缓存
+        for stale in _CACHE_DIR.glob(f"v*-{path_hash}-*.txt.gz"):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+    return text
+
+
+def _extract_text_uncached(md_path: str) -> str:
+    """extract_text_from_markdown 的实际提取逻辑，不走缓存"""
+    buf = io.StringIO()
+    write = buf.write
+    # 输出末尾的连续换行数，写入时直接限制在 2 个以内（合并多余空行）
+    newlines = 0
+    # 上一次输出是否为空行；初始为 True，开头不输出空行
+    last_blank = True
     in_table = False
-    skip_sections = {'📹 视频信息', '📑 章节导航表', '🏢 提及的公司', '📺 视频类型判断'}
     current_section = ""
     skip_current = False
 
-    for line in lines:
-        stripped = line.strip()
-
-        # 检测章节标题
-        if stripped.startswith('## '):
-            section_title = stripped[3:].strip()
-            current_section = section_title
-            skip_current = any(skip in section_title for skip in skip_sections)
-            if not skip_current:
-                # 添加章节标题作为朗读提示
-                result.append(f"\n{section_title}\n")
-            continue
-
-        if skip_current:
-            continue
-
-        # 跳过表格
-        if '|' in stripped and stripped.startswith('|'):
-            in_table = True
-            continue
-        if in_table and not stripped:
-            in_table = False
-            continue
-        if in_table:
-            continue
-
-        # 跳过空行和分隔线
-        if not stripped or stripped == '---':
-            if result and result[-1] != '\n':
-                result.append('\n')
-            continue
-
-        # 跳过图片和链接行
-        if stripped.startswith('![') or stripped.startswith('- **原始链接**'):
-            continue
+    # 逐行处理，不在内存中保留整份文件内容
+    with open(md_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            stripped = line.strip()
+            # 按首字符分派，每行只做与该字符相关的前缀判断
+            first = stripped[:1]
+
+            # 检测章节标题
+            if first == '#' and stripped.startswith('## '):
+                section_title = stripped[3:].strip()
+                current_section = section_title
+                skip_current = _SKIP_SECTIONS_RE.search(section_title) is not None
+                if not skip_current:
+                    # 添加章节标题作为朗读提示
+                    if newlines < 2:
+                        write('\n')
+                    write(f"{section_title}\n")
+                    newlines = 1
+                    last_blank = False
+                continue
+
+            if skip_current:
+                continue
+
+            # 跳过表格
+            if first == '|':
+                in_table = True
+                continue
+            if in_table:
+                if not stripped:
+                    in_table = False
+                continue
+
+            # 跳过空行和分隔线
+            if not stripped or stripped == '---':
+                if not last_blank:
+                    if newlines < 2:
+                        write('\n')
+                        newlines += 1
+                    last_blank = True
+                continue
+
+            if first == '-':
+                if stripped.startswith('- **'):
+                    # 跳过原始链接行和元数据行
+                    if stripped.startswith('- **原始链接**') or '**:' in stripped:
+                        continue
+                if stripped[1:2] == ' ':
+                    # 处理列表项，去掉加粗标记
+                    item = _BOLD_RE.sub(r'\1', stripped[2:].strip())
+                    write(f"{item}\n")
+                    newlines = 1
+                    last_blank = False
+                    continue
+            elif first == '*':
+                # 跳过生成时间
+                if stripped.startswith('*生成时间'):
+                    continue
+                if stripped[1:2] == ' ':
+                    item = _BOLD_RE.sub(r'\1', stripped[2:].strip())
+                    write(f"{item}\n")
+                    newlines = 1
+                    last_blank = False
+                    continue
+            elif first == '#':
+                # 处理标题
+                if stripped[1:2] == ' ':
+                    title = stripped[2:].strip()
+                    write(f"标题：{title}\n\n")
+                    newlines = 2
+                    last_blank = False
+                    continue
+                if stripped.startswith('### '):
+                    subtitle = stripped[4:].strip()
+                    # 处理章节时间戳格式 (0:00 - 5:00) Title
+                    subtitle = _HEADING_TS_RE.sub('', subtitle)
+                    if newlines < 2:
+                        write('\n')
+                        newlines += 1
+                    if subtitle:
+                        write(subtitle)
+                        newlines = 0
+                    if newlines < 2:
+                        write('\n')
+                        newlines += 1
+                    last_blank = False
+                    continue
+            elif first == '>':
+                # 处理引用块
+                if stripped[1:2] == ' ':
+                    quote = stripped[2:].strip()
+                    write(f"引用：{quote}\n")
+                    newlines = 1
+                    last_blank = False
+                    continue
+            elif first == '!':
+                # 跳过图片
+                if stripped[1:2] == '[':
+                    continue
+
+            # 处理普通段落
+            # 去掉 Markdown 格式
+            text = _strip_inline_format(stripped)
+
+            if text:
+                write(f"{text}\n")
+                newlines = 1
+                last_blank = False
+
+    return buf.getvalue().strip()
 
-        # 跳过元数据行
-        if stripped.startswith('- **') and '**:' in stripped:
-            continue
 
-        # 跳过生成时间
-        if stripped.startswith('*生成时间'):
-            continue
+async def generate_audio(text: str, output_path: str, voice: str = DEFAULT_VOICE):
+    """
+    使用 Edge TTS 生成音频
 
-        # 处理标题
-        if stripped.startswith('# '):
-            title = stripped[2:].strip()
-            result.append(f"标题：{title}\n\n")
-            continue
+    Args:
+        text: 要朗读的文本
+        output_path: 输出 MP3 文件路径
+        voice: 语音名称
+    """
+    communicate = edge_tts.Communicate(text, voice)
+    # 边合成边写盘，内存里只保留当前音频块
+    with open(output_path, 'wb') as f:
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                f.write(chunk["data"])
 
-        if stripped.startswith('### '):
-            subtitle = stripped[4:].strip()
-            # 处理章节时间戳格式 (0:00 - 5:00) Title
-            subtitle = re.sub(r'\([\d:]+\s*-\s*[\d:]+\)\s*', '', subtitle)
-            result.append(f"\n{subtitle}\n")
-            continue
 
-        # 处理引用块
-        if stripped.startswith('> '):
-            quote = stripped[2:].strip()
-            result.append(f"引用：{quote}\n")
-            continue
+def _split_for_tts(text: str, max_chars: int = _TTS_CHUNK_CHARS) -> List[str]:
+    """
+    按句子边界把文本打包成不超过 max_chars 的片段
 
-        # 处理列表项
-        if stripped.startswith('- ') or stripped.startswith('* '):
-            item = stripped[2:].strip()
-            # 去掉加粗标记
-            item = re.sub(r'\*\*([^*]+)\*\*', r'\1', item)
-            result.append(f"{item}\n")
+    单个句子本身超长时单独成段，不在句中截断
+    """
+    chunks = []
+    current = []
+    size = 0
+    for sentence in _SENTENCE_SPLIT_RE.split(text):
+        if not sentence:
             continue
-
-        # 处理普通段落
-        # 去掉 Markdown 格式
-        text = stripped
-        # 去掉时间戳标记 **(0:00 - 1:15)** 格式
-        text = re.sub(r'\*\*\([\d:]+\s*-\s*[\d:]+\)\*\*', '', text)
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # 加粗
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)       # 斜体
-        text = re.sub(r'`([^`]+)`', r'\1', text)         # 代码
-        text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)  # 链接
-
-        if text:
-            result.append(f"{text}\n")
-
-    # 合并结果，去掉多余空行
-    final_text = ''.join(result)
-    final_text = re.sub(r'\n{3,}', '\n\n', final_text)
-
-    return final_text.strip()
-
-
-async def generate_audio(text: str, output_path: str, voice: str = DEFAULT_VOICE):
+        if current and size + len(sentence) + 1 > max_chars:
+            chunks.append('\n'.join(current))
+            current = []
+            size = 0
+        current.append(sentence)
+        size += len(sentence) + 1
+    if current:
+        chunks.append('\n'.join(current))
+    return chunks
+
+
+async def generate_audio_parallel(
+    text: str,
+    output_path: str,
+    voice: str = DEFAULT_VOICE,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    reencode: bool = False
+):
     """
-    使用 Edge TTS 生成音频
+    分段并发生成音频，再按顺序拼接成一个 MP3
+
+    Edge TTS 按连接限速，多路并发可以接近线性提速；MP3 帧可以直接按字节拼接
 
     Args:
         text: 要朗读的文本
         output_path: 输出 MP3 文件路径
         voice: 语音名称
+        semaphore: 限制并发连接数（可选，多个文件共享同一个时总并发不超过其上限）
+        reencode: 用 ffmpeg 解码各段后整体编码一次，消除拼接处的帧边界杂音（需要 ffmpeg）
     """
-    communicate = edge_tts.Communicate(text, voice)
-    await communicate.save(output_path)
+    # 限制并发数，避免被服务端封禁
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_TTS_CONCURRENCY)
+
+    chunks = _split_for_tts(text)
+    if len(chunks) <= 1:
+        async with semaphore:
+            await generate_audio(text, output_path, voice)
+        return
+
+    async def _generate_part(chunk: str, part_path: str):
+        async with semaphore:
+            await generate_audio(chunk, part_path, voice)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        part_paths = [str(Path(tmp_dir) / f"part_{i:04d}.mp3") for i in range(len(chunks))]
+        tasks = [
+            asyncio.create_task(_generate_part(chunk, part_path))
+            for chunk, part_path in zip(chunks, part_paths)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # 任一分段失败时取消其余分段，等它们退出后再删除临时目录
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        if reencode and shutil.which("ffmpeg"):
+            await _reencode_parts(part_paths, output_path)
+            return
+        if reencode:
+            print("⚠️ 未找到 ffmpeg，直接拼接 MP3")
+
+        with open(output_path, 'wb') as out:
+            for part_path in part_paths:
+                out.write(Path(part_path).read_bytes())
+
+
+async def _reencode_parts(part_paths: List[str], output_path: str):
+    """
+    用 ffmpeg concat 按顺序解码各段 MP3，只编码一次输出
+
+    Edge TTS 只提供 MP3 输出，无法直接取 PCM，所以由 ffmpeg 解码后统一编码
+    """
+    list_path = Path(part_paths[0]).parent / "parts.txt"
+    list_path.write_text(''.join(f"file '{p}'\n" for p in part_paths), encoding='utf-8')
+
+    proc = await asyncio.create_subprocess_exec(
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-f", "concat", "-safe", "0", "-i", str(list_path),
+        "-c:a", "libmp3lame", "-b:a", _REENCODE_BITRATE,
+        output_path,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg 编码失败: {stderr.decode('utf-8', errors='replace').strip()}")
 
 
 def process_translation_to_audio(
     md_path: str,
     output_path: str = None,
-    voice: str = DEFAULT_VOICE
+    voice: str = DEFAULT_VOICE,
+    reencode: bool = False
 ) -> str:
     """
     将翻译文件转换为音频
@@ -172,6 +376,7 @@ def process_translation_to_audio(
         md_path: Markdown 文件路径
         output_path: 输出路径（可选，默认在 outputs/ 目录）
         voice: 语音名称
+        reencode: 分段合成后用 ffmpeg 整体重新编码
 
     Returns:
         输出文件路径
@@ -193,21 +398,118 @@ def process_translation_to_audio(
     # 确定输出路径
     if output_path is None:
         # 使用脚本所在目录的 outputs 子目录
-        script_dir = Path(__file__).resolve().parent
-        output_dir = script_dir / "outputs"
-        output_dir.mkdir(exist_ok=True)
-        output_path = output_dir / f"{md_path.stem}.mp3"
+        output_path = _default_output_dir() / f"{md_path.stem}.mp3"
     else:
         output_path = Path(output_path)
 
     # 生成音频
     print(f"🎙️ 正在生成音频 (语音: {voice})...")
-    asyncio.run(generate_audio(text, str(output_path), voice))
+    asyncio.run(generate_audio_parallel(text, str(output_path), voice, reencode=reencode))
 
     print(f"✅ 完成: {output_path}")
     return str(output_path)
 
 
+def _default_output_dir() -> Path:
+    """脚本所在目录的 outputs 子目录"""
+    output_dir = Path(__file__).resolve().parent / "outputs"
+    output_dir.mkdir(exist_ok=True)
+    return output_dir
+
+
+def _collect_inputs(inputs: List[str]) -> List[Path]:
+    """
+    展开输入参数：目录取其中的 .md 文件，通配符按 glob 匹配，其余按文件路径
+
+    同一个文件出现多次时只保留一次；输出文件按文件名命名，
+    不同文件同名会互相覆盖，因此直接报错
+
+    Raises:
+        ValueError: 不同输入文件的文件名（不含扩展名）相同
+    """
+    md_paths = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            md_paths.extend(sorted(path.glob("*.md")))
+        elif not path.exists() and glob.has_magic(item):
+            md_paths.extend(sorted(Path(p) for p in glob.glob(item)))
+        else:
+            md_paths.append(path)
+
+    unique = {}
+    for path in md_paths:
+        unique.setdefault(path.resolve(), path)
+    by_stem = {}
+    for path in unique.values():
+        by_stem.setdefault(path.stem, []).append(path)
+    clashes = [paths for paths in by_stem.values() if len(paths) > 1]
+    if clashes:
+        names = "; ".join(", ".join(map(str, paths)) for paths in clashes)
+        raise ValueError(f"输出文件名冲突（文件名相同）: {names}")
+    return list(unique.values())
+
+
+async def _process_many(md_paths: List[Path], output_dir: Path, voice: str, reencode: bool) -> int:
+    """
+    批量转换多个文件：文本提取放到线程里，所有文件共享一个并发上限
+
+    Returns:
+        失败的文件数
+    """
+    semaphore = asyncio.Semaphore(_TTS_CONCURRENCY)
+
+    async def _one(md_path: Path) -> bool:
+        try:
+            if not md_path.exists():
+                raise FileNotFoundError(f"文件不存在: {md_path}")
+            text = await asyncio.to_thread(extract_text_from_markdown, str(md_path))
+            if not text:
+                raise ValueError("提取的文本为空")
+            output_path = output_dir / f"{md_path.stem}.mp3"
+            await generate_audio_parallel(text, str(output_path), voice, semaphore, reencode)
+        except Exception as e:
+            print(f"❌ {md_path.name}: {e}")
+            return False
+        print(f"✅ 完成: {output_path}")
+        return True
+
+    results = await asyncio.gather(*(_one(md_path) for md_path in md_paths))
+    return results.count(False)
+
+
+def process_many_to_audio(
+    inputs: List[str],
+    output_dir: str = None,
+    voice: str = DEFAULT_VOICE,
+    reencode: bool = False
+) -> int:
+    """
+    将多个翻译文件（或目录、通配符）转换为音频
+
+    Args:
+        inputs: Markdown 文件、目录或通配符
+        output_dir: 输出目录（可选，默认在 outputs/ 目录）
+        voice: 语音名称
+        reencode: 分段合成后用 ffmpeg 整体重新编码
+
+    Returns:
+        失败的文件数
+    """
+    md_paths = _collect_inputs(inputs)
+    if not md_paths:
+        raise FileNotFoundError(f"没有找到 Markdown 文件: {' '.join(inputs)}")
+
+    if output_dir is None:
+        out_dir = _default_output_dir()
+    else:
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"🎙️ 正在生成 {len(md_paths)} 个音频 (语音: {voice})...")
+    return asyncio.run(_process_many(md_paths, out_dir, voice, reencode))
+
+
 def list_voices():
     """列出可用的中文语音"""
     print("可用的中文语音:")
@@ -227,16 +529,23 @@ def main():
   python tts_generator.py input.md
   python tts_generator.py input.md --voice yunxi
   python tts_generator.py input.md -o podcast.mp3
+  python tts_generator.py a.md b.md -o podcasts/
+  python tts_generator.py ../ai_output/summary/Y_Combinator/
   python tts_generator.py --list-voices
         """
     )
-    parser.add_argument("input", nargs="?", help="输入的 Markdown 文件路径")
-    parser.add_argument("-o", "--output", help="输出的 MP3 文件路径")
+    parser.add_argument("inputs", nargs="*", help="输入的 Markdown 文件路径（可以是多个文件、目录或通配符）")
+    parser.add_argument("-o", "--output", help="输出的 MP3 文件路径；多个输入时为输出目录")
     parser.add_argument(
         "-v", "--voice",
         default="yunjian",
         help="语音名称 (xiaoxiao/yunxi/xiaoyi/yunjian 或完整语音ID)，默认 yunjian"
     )
+    parser.add_argument(
+        "--reencode",
+        action="store_true",
+        help="分段合成后用 ffmpeg 整体重新编码一次，消除拼接处杂音（需要 ffmpeg）"
+    )
     parser.add_argument("--list-voices", action="store_true", help="列出可用语音")
 
     args = parser.parse_args()
@@ -245,7 +554,7 @@ def main():
         list_voices()
         return
 
-    if not args.input:
+    if not args.inputs:
         parser.print_help()
         return
 
@@ -253,7 +562,14 @@ def main():
     voice = VOICES.get(args.voice, args.voice)
 
     try:
-        process_translation_to_audio(args.input, args.output, voice)
+        # 单个文件保持原来的行为，多个文件/目录/通配符并发处理
+        single = args.inputs[0]
+        if len(args.inputs) == 1 and (
+            Path(single).is_file() or not (Path(single).is_dir() or glob.has_magic(single))
+        ):
+            process_translation_to_audio(args.inputs[0], args.output, voice, args.reencode)
+        elif process_many_to_audio(args.inputs, args.output, voice, args.reencode):
+            sys.exit(1)
     except Exception as e:
         print(f"❌ 错误: {e}")
         sys.exit(1)
@@ -17,6 +17,7 @@ from .srt_parser import (
     extract_text,
     clean_text,
     get_text_for_time_range,
+    SubtitleIndex,
 )
 
 __all__ = [
@@ -37,4 +38,5 @@ __all__ = [
     "extract_text",
     "clean_text",
     "get_text_for_time_range",
+    "SubtitleIndex",
 ]
@@ -6,11 +6,28 @@ Based on working implementation from /home/sunj11/youtube_monitor/clean_srt.py
 
 import re
 import logging
-from typing import List, Tuple, Optional
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import accumulate, chain
+from typing import List, Tuple, Optional, Union
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Punctuation that ends a sentence in subtitle text
+_SENT_ENDS = ('.', '?', '!')
+
+# Zero-padded two-digit strings for timestamp fields
+_D2 = tuple(f"{i:02d}" for i in range(100))
+
+# parse_srt / parse_srt_content line states
+_EXPECT_INDEX = 0
+_EXPECT_TIMING = 1
+_IN_TEXT = 2
+_SKIP_BLOCK = 3
+
 
 @dataclass
 class SubtitleEntry:
@@ -43,37 +60,78 @@ def parse_srt(srt_text: str) -> List[Tuple[int, int, str]]:
         List of (start_seconds, end_seconds, text) tuples
     """
     entries = []
-    blocks = re.split(r'\n\n+', srt_text.strip())
-
-    for block in blocks:
-        lines = block.strip().split('\n')
-        if len(lines) < 3:
-            continue
-
-        # Parse timestamp line
-        time_match = re.search(
-            r'(\d{2}):(\d{2}):(\d{2})[,.](\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2})[,.](\d{3})',
-            lines[1]
-        )
-        if not time_match:
-            continue
-
-        start_sec = (int(time_match.group(1)) * 3600 +
-                     int(time_match.group(2)) * 60 +
-                     int(time_match.group(3)))
-        end_sec = (int(time_match.group(5)) * 3600 +
-                   int(time_match.group(6)) * 60 +
-                   int(time_match.group(7)))
-        text = ' '.join(lines[2:]).strip()
-
-        # Remove HTML tags (like <c>, <font>, etc.)
-        text = re.sub(r'<[^>]+>', '', text)
-
-        entries.append((start_sec, end_sec, text))
+    state = _EXPECT_INDEX
+    stamps = None
+    texts = []
+
+    # A trailing blank line flushes the last block
+    for line in chain(srt_text.splitlines(), ('',)):
+        if not line.strip():
+            if state == _IN_TEXT and texts:
+                text = ' '.join(texts).strip()
+                # Remove HTML tags (like <c>, <font>, etc.)
+                if '<' in text:
+                    text = _HTML_TAG_RE.sub('', text)
+                entries.append((_stamp_seconds(stamps[0]), _stamp_seconds(stamps[1]), text))
+            state = _EXPECT_INDEX
+        elif state == _EXPECT_INDEX:
+            state = _EXPECT_TIMING
+        elif state == _EXPECT_TIMING:
+            stamps = _split_timing_line(line)
+            state = _IN_TEXT if stamps else _SKIP_BLOCK
+            # Reuse one buffer; each block's text is joined before the next clear
+            texts.clear()
+        elif state == _IN_TEXT:
+            texts.append(line)
 
     return entries
 
 
+def _is_srt_stamp(ts: str) -> bool:
+    """Check for the fixed HH:MM:SS,mmm (or HH:MM:SS.mmm) layout."""
+    return (
+        len(ts) == 12
+        and ts[2] == ':' and ts[5] == ':' and ts[8] in ',.'
+        and ts[0:2].isdecimal() and ts[3:5].isdecimal()
+        and ts[6:8].isdecimal() and ts[9:12].isdecimal()
+    )
+
+
+def _split_timing_line(line: str) -> Optional[Tuple[str, str]]:
+    """
+    Split an SRT timing line into its start and end stamps.
+
+    Stamps have a fixed layout, so they are located relative to the
+    "-->" arrow and checked by position instead of with a regex. Any
+    trailing cue settings (e.g. "align:start") are ignored.
+
+    Args:
+        line: Timing line like "00:01:23,456 --> 00:01:25,000"
+
+    Returns:
+        (start_stamp, end_stamp) or None if the line is not a timing line
+    """
+    arrow = line.find('-->')
+    if arrow < 0:
+        return None
+    start = line[:arrow].rstrip()[-12:]
+    end = line[arrow + 3:].lstrip()[:12]
+    if _is_srt_stamp(start) and _is_srt_stamp(end):
+        return start, end
+    return None
+
+
+def _stamp_seconds(ts: str) -> int:
+    """Whole seconds of a validated HH:MM:SS,mmm stamp."""
+    return int(ts[0:2]) * 3600 + int(ts[3:5]) * 60 + int(ts[6:8])
+
+
+def _stamp_seconds_float(ts: str) -> float:
+    """Seconds (with milliseconds) of a validated HH:MM:SS,mmm stamp."""
+    # Dividing whole milliseconds rounds exactly like float("SS.mmm")
+    return int(ts[0:2]) * 3600 + int(ts[3:5]) * 60 + (int(ts[6:8]) * 1000 + int(ts[9:12])) / 1000
+
+
 def parse_srt_full(srt_text: str) -> List[Tuple[int, int, str]]:
     """
     Parse SRT into [(start_sec, end_sec, text), ...].
@@ -101,26 +159,24 @@ def merge_by_sentence(entries: List[Tuple[int, int, str]], interval: int = 30) -
     current_start = entries[0][0]
     current_texts = []
     last_end = entries[0][1]
+    # Whether the previous entry ends a sentence, tested once per entry
+    prev_ends_sentence = False
 
     for start_sec, end_sec, text in entries:
-        # Determine if we need to split
+        # Split when:
         # 1. Exceeded time interval
-        # 2. Previous sentence ends with punctuation and there's a pause
-        should_split = False
-
-        if start_sec - current_start >= interval:
-            should_split = True
-        elif current_texts and current_texts[-1].rstrip().endswith(('.', '?', '!')):
-            if start_sec - last_end > 2:  # Pause > 2 seconds
-                should_split = True
-
-        if should_split and current_texts:
+        # 2. Previous sentence ends with punctuation and there's a pause > 2 seconds
+        if current_texts and (
+            start_sec - current_start >= interval
+            or (prev_ends_sentence and start_sec - last_end > 2)
+        ):
             merged.append((current_start, ' '.join(current_texts)))
             current_start = start_sec
             current_texts = [text]
         else:
             current_texts.append(text)
 
+        prev_ends_sentence = text.rstrip().endswith(_SENT_ENDS)
         last_end = end_sec
 
     # Add the last segment
@@ -130,6 +186,7 @@ def merge_by_sentence(entries: List[Tuple[int, int, str]], interval: int = 30) -
     return merged
 
 
+@lru_cache(maxsize=8192, typed=True)
 def format_time(seconds: int) -> str:
     """
     Convert seconds to MM:SS or HH:MM:SS format.
@@ -142,16 +199,23 @@ def format_time(seconds: int) -> str:
     """
     if seconds is None:
         return "End"
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
 
     if hours > 0:
-        return f"{hours}:{minutes:02d}:{secs:02d}"
+        return f"{hours}:{_D2[minutes]}:{_D2[secs]}"
     else:
-        return f"{minutes}:{secs:02d}"
+        return f"{minutes}:{_D2[secs]}"
+
 
+@lru_cache(maxsize=8192, typed=True)
+def _format_mmss(seconds: int) -> str:
+    """format_time for 0 <= seconds < 3600: MM:SS without the hours check."""
+    minutes, secs = divmod(seconds, 60)
+    return f"{minutes}:{_D2[secs]}"
 
+
+@lru_cache(maxsize=4096)
 def format_timestamp(seconds: float) -> str:
     """
     Format seconds as SRT timestamp (HH:MM:SS,mmm).
@@ -162,11 +226,12 @@ def format_timestamp(seconds: float) -> str:
     Returns:
         SRT formatted timestamp
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    # Round to whole milliseconds once, so parsed stamps format back unchanged
+    total_secs, millis = divmod(round(seconds * 1000), 1000)
+    total_mins, secs = divmod(total_secs, 60)
+    hours, minutes = divmod(total_mins, 60)
+    hh = _D2[hours] if 0 <= hours < 100 else f"{hours:02d}"
+    return f"{hh}:{_D2[minutes]}:{_D2[secs]},{millis:03d}"
 
 
 def format_time_range(start_sec: int, end_sec: Optional[int] = None) -> str:
@@ -199,14 +264,21 @@ def clean_subtitle(raw_srt: str, interval: int = 30) -> str:
     entries = parse_srt(raw_srt)
     merged = merge_by_sentence(entries, interval)
 
-    output_lines = []
-    for start_sec, text in merged:
-        output_lines.append(f"({format_time(start_sec)}) {text}")
+    # Under an hour every label is MM:SS, so skip format_time's hours branch
+    if all(0 <= start_sec < 3600 for start_sec, _ in merged):
+        fmt = _format_mmss
+    else:
+        fmt = format_time
 
-    return '\n\n'.join(output_lines)
+    return '\n\n'.join([f"({fmt(start_sec)}) {text}" for start_sec, text in merged])
 
 
-def get_segment_text(srt_entries: List[Tuple[int, int, str]], start_sec: int, end_sec: Optional[int]) -> str:
+def get_segment_text(
+    srt_entries: List[Tuple[int, int, str]],
+    start_sec: int,
+    end_sec: Optional[int],
+    index: Optional["SubtitleIndex"] = None,
+) -> str:
     """
     Extract subtitle text for a time range.
 
@@ -214,26 +286,14 @@ def get_segment_text(srt_entries: List[Tuple[int, int, str]], start_sec: int, en
         srt_entries: List of (start_sec, end_sec, text) tuples
         start_sec: Start time in seconds
         end_sec: End time in seconds (None for till end)
+        index: SubtitleIndex built from srt_entries, to reuse across calls
 
     Returns:
         Combined text for the time range
     """
-    texts = []
-
-    for entry_start, entry_end, text in srt_entries:
-        if entry_start >= start_sec:
-            if end_sec is None or entry_start < end_sec:
-                texts.append(text)
-            elif entry_start >= end_sec:
-                # Extend to sentence boundary
-                if texts and not texts[-1].rstrip().endswith(('.', '?', '!')):
-                    texts.append(text)
-                    if text.rstrip().endswith(('.', '?', '!')):
-                        break
-                else:
-                    break
-
-    return '\n'.join(texts)
+    if index is None:
+        index = SubtitleIndex(srt_entries)
+    return index.segment_text(start_sec, end_sec)
 
 
 def get_last_lines(text: str, n: int = 5) -> str:
@@ -262,9 +322,11 @@ def parse_srt_file(file_path: str) -> List[SubtitleEntry]:
         List of SubtitleEntry objects
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        return parse_srt_content(content)
+        # One binary read and a single decode; splitlines() in the parser
+        # handles CRLF, so text-mode newline translation is not needed
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        return parse_srt_content(raw.decode("utf-8", errors="replace"))
     except FileNotFoundError:
         logger.error(f"SRT file not found: {file_path}")
         raise
@@ -284,50 +346,36 @@ def parse_srt_content(content: str) -> List[SubtitleEntry]:
         List of SubtitleEntry objects
     """
     entries = []
-    blocks = re.split(r"\n\s*\n", content.strip())
-    index = 0
-
-    for block in blocks:
-        if not block.strip():
-            continue
-
-        lines = block.strip().split("\n")
-        if len(lines) < 3:
-            continue
-
-        try:
-            # Parse timestamps
-            timestamp_line = lines[1].strip()
-            match = re.match(
-                r"(\d{2}:\d{2}:\d{2}[.,]\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}[.,]\d{3})",
-                timestamp_line,
-            )
-
-            if not match:
-                continue
-
-            start_ts = match.group(1).replace(",", ".")
-            end_ts = match.group(2).replace(",", ".")
-
-            start_sec = parse_timestamp_to_seconds(start_ts)
-            end_sec = parse_timestamp_to_seconds(end_ts)
-
-            if start_sec is None or end_sec is None:
-                continue
-
-            # Parse text (remaining lines)
-            text = "\n".join(lines[2:]).strip()
-            # Clean HTML tags
-            text = re.sub(r'<[^>]+>', '', text)
-
-            index += 1
-            entries.append(
-                SubtitleEntry(index=index, start_sec=start_sec, end_sec=end_sec, text=text)
-            )
+    state = _EXPECT_INDEX
+    stamps = None
+    texts = []
 
-        except (ValueError, IndexError) as e:
-            logger.warning(f"Failed to parse subtitle block: {e}")
-            continue
+    # A trailing blank line flushes the last block
+    for line in chain(content.splitlines(), ('',)):
+        if not line.strip():
+            if state == _IN_TEXT and texts:
+                text = "\n".join(texts).strip()
+                # Clean HTML tags
+                if '<' in text:
+                    text = _HTML_TAG_RE.sub('', text)
+                entries.append(
+                    SubtitleEntry(
+                        index=len(entries) + 1,
+                        start_sec=_stamp_seconds_float(stamps[0]),
+                        end_sec=_stamp_seconds_float(stamps[1]),
+                        text=text,
+                    )
+                )
+            state = _EXPECT_INDEX
+        elif state == _EXPECT_INDEX:
+            state = _EXPECT_TIMING
+        elif state == _EXPECT_TIMING:
+            stamps = _split_timing_line(line.strip())
+            state = _IN_TEXT if stamps else _SKIP_BLOCK
+            # Reuse one buffer; each block's text is joined before the next clear
+            texts.clear()
+        elif state == _IN_TEXT:
+            texts.append(line)
 
     if not entries:
         logger.warning("No valid subtitle entries found")
@@ -337,6 +385,7 @@ def parse_srt_content(content: str) -> List[SubtitleEntry]:
     return entries
 
 
+@lru_cache(maxsize=4096)
 def parse_timestamp_to_seconds(timestamp: str) -> Optional[float]:
     """
     Parse SRT timestamp to seconds.
@@ -347,6 +396,10 @@ def parse_timestamp_to_seconds(timestamp: str) -> Optional[float]:
     Returns:
         Seconds as float, or None if invalid
     """
+    # Fast path: fixed HH:MM:SS,mmm / HH:MM:SS.mmm layout
+    if _is_srt_stamp(timestamp):
+        return _stamp_seconds_float(timestamp)
+
     try:
         timestamp = timestamp.replace(",", ".")
         parts = timestamp.split(":")
@@ -389,15 +442,14 @@ def clean_text(text: str) -> str:
     Returns:
         Cleaned text
     """
-    # Remove HTML tags
-    text = re.sub(r"<[^>]+>", "", text)
-
-    # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text).strip()
+    # Remove HTML tags, then collapse whitespace (split() trims the ends too)
+    if '<' in text:
+        text = _HTML_TAG_RE.sub('', text)
+    text = ' '.join(text.split())
 
     # Remove common artifacts
-    text = text.replace("♪", "").replace("♫", "")
-
+    if '♪' in text or '♫' in text:
+        text = text.replace("♪", "").replace("♫", "")
     return text
 
 
@@ -406,6 +458,7 @@ def get_text_for_time_range(
     start_sec: float,
     end_sec: float,
     join_with: str = " ",
+    index: Optional["SubtitleIndex"] = None,
 ) -> str:
     """
     Get combined text for subtitle entries within a time range.
@@ -415,15 +468,101 @@ def get_text_for_time_range(
         start_sec: Start time in seconds
         end_sec: End time in seconds
         join_with: String to join text blocks
+        index: SubtitleIndex built from entries, to reuse across calls
 
     Returns:
         Combined text for entries in the time range
     """
-    matching_entries = []
-    for entry in entries:
-        # Check if entry overlaps with the time range
-        if entry.start_sec < end_sec and entry.end_sec > start_sec:
-            matching_entries.append(entry)
+    if index is None:
+        index = SubtitleIndex(entries)
+    return index.text_for_range(start_sec, end_sec, join_with)
 
-    texts = [entry.text for entry in matching_entries]
-    return join_with.join(texts)
+
+class SubtitleIndex:
+    """
+    Start-time index over a subtitle list for repeated range queries.
+
+    Accepts SubtitleEntry objects or (start_sec, end_sec, text) tuples. When
+    the entries are sorted by start time, each query bisects to its first
+    candidate instead of scanning the whole list; unsorted input falls back
+    to a full scan. Build one per entry list and pass it to
+    get_segment_text / get_text_for_time_range to share it across queries.
+    The index copies what it needs, so later edits to the list are not seen;
+    build a new index after changing the entries.
+    """
+
+    def __init__(self, entries: Union[List[SubtitleEntry], List[Tuple[int, int, str]]]):
+        self.entries = entries
+        self.size = len(entries)
+        if entries and isinstance(entries[0], tuple):
+            self._starts = [entry[0] for entry in entries]
+            ends = [entry[1] for entry in entries]
+            self._texts = [entry[2] for entry in entries]
+        else:
+            self._starts = [entry.start_sec for entry in entries]
+            ends = [entry.end_sec for entry in entries]
+            self._texts = [entry.text for entry in entries]
+        self._ends = ends
+        self.is_sorted = all(a <= b for a, b in zip(self._starts, self._starts[1:]))
+        # Running maximum of end times, so overlap lookups can bisect too
+        self._max_ends = list(accumulate(ends, max)) if self.is_sorted else []
+        self._ends_sorted = self.is_sorted and self._max_ends == ends
+
+    def text_for_range(self, start_sec: float, end_sec: float, join_with: str = " ") -> str:
+        """
+        Get combined text for entries overlapping [start_sec, end_sec).
+
+        Args:
+            start_sec: Start time in seconds
+            end_sec: End time in seconds
+            join_with: String to join text blocks
+
+        Returns:
+            Combined text for entries in the time range
+        """
+        starts, ends, texts = self._starts, self._ends, self._texts
+        if not self.is_sorted:
+            return join_with.join([
+                texts[i] for i in range(self.size)
+                if starts[i] < end_sec and ends[i] > start_sec
+            ])
+
+        # Everything before hi starts before end_sec; from lo on, the
+        # running max end is past start_sec
+        lo = bisect_right(self._max_ends, start_sec)
+        hi = bisect_left(starts, end_sec)
+        if self._ends_sorted:
+            # Each end equals the running max, so the slice is exact
+            return join_with.join(texts[lo:hi])
+        return join_with.join([texts[i] for i in range(lo, hi) if ends[i] > start_sec])
+
+    def segment_text(self, start_sec: int, end_sec: Optional[int]) -> str:
+        """
+        Extract text for a chapter, extending past end_sec to a sentence boundary.
+
+        Args:
+            start_sec: Start time in seconds
+            end_sec: End time in seconds (None for till end)
+
+        Returns:
+            Combined text for the time range
+        """
+        lo = bisect_left(self._starts, start_sec) if self.is_sorted else 0
+        texts = []
+
+        for i in range(lo, self.size):
+            entry_start = self._starts[i]
+            text = self._texts[i]
+            if entry_start >= start_sec:
+                if end_sec is None or entry_start < end_sec:
+                    texts.append(text)
+                elif entry_start >= end_sec:
+                    # Extend to sentence boundary
+                    if texts and not texts[-1].rstrip().endswith(_SENT_ENDS):
+                        texts.append(text)
+                        if text.rstrip().endswith(_SENT_ENDS):
+                            break
+                    else:
+                        break
+
+        return '\n'.join(texts)
@@ -1,12 +1,81 @@
 """Time parsing and manipulation utilities."""
 
 from datetime import datetime, timedelta
-import re
+from functools import lru_cache
+from itertools import islice
 import logging
+from operator import itemgetter
 from typing import Optional, Tuple
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 logger = logging.getLogger(__name__)
 
+# strptime fallbacks for parse_iso_date, tried in order, with the shortest
+# and longest input each can match. strptime takes one-digit month, day and
+# time fields ("2025-1-5"), and the space matches any run of whitespace.
+_ISO_DATE_FORMATS = (
+    ("%Y-%m-%dT%H:%M:%SZ", 15, 20),
+    ("%Y-%m-%dT%H:%M:%S", 14, 19),
+    ("%Y-%m-%d %H:%M:%S", 14, None),
+    ("%Y-%m-%d", 8, 10),
+    ("%Y%m%d", 6, 8),
+)
+
+# Candidate formats per stripped input length, so strptime only runs on
+# formats that could match; longer inputs fall back to _LONG_DATE_FORMATS
+_FMTS_BY_LEN = {
+    n: tuple(
+        fmt for fmt, lo, hi in _ISO_DATE_FORMATS if lo <= n and (hi is None or n <= hi)
+    )
+    for n in range(21)
+}
+_LONG_DATE_FORMATS = tuple(fmt for fmt, _, hi in _ISO_DATE_FORMATS if hi is None)
+
+# "00".."99" for zero-padded clock fields
+_D2 = tuple(f"{i:02d}" for i in range(100))
+
+# Seconds per unit letter in human-readable durations ("1h 23m 45s")
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def _parse_timestamp(timestamp_str: str) -> Tuple[Optional[float], Optional[tuple]]:
+    """Parse a timestamp; return (seconds, None) or (None, warning log args)."""
+    try:
+        timestamp_str = timestamp_str.strip()
+
+        # Handle milliseconds; a short fraction is right-padded (".5" -> 500ms)
+        milliseconds = 0.0
+        if "." in timestamp_str:
+            timestamp_str, _, ms_str = timestamp_str.rpartition(".")
+            if len(ms_str) != 3:
+                ms_str = ms_str[:3]
+                if ms_str.isdecimal():
+                    ms_str = ms_str.ljust(3, "0")
+            milliseconds = int(ms_str) / 1000.0
+
+        parts = timestamp_str.split(":")
+        if len(parts) == 2:
+            minutes, seconds = parts
+            return int(minutes) * 60 + int(seconds) + milliseconds, None
+        elif len(parts) == 3:
+            hours, minutes, seconds = parts
+            return int(hours) * 3600 + int(minutes) * 60 + int(seconds) + milliseconds, None
+        else:
+            return None, ("Invalid timestamp format: %s", timestamp_str)
+
+    except (ValueError, AttributeError) as e:
+        # str(e): a cached exception would pin its traceback frames
+        return None, ("Failed to parse timestamp '%s': %s", timestamp_str, str(e))
+
+
+# Transcripts repeat the same timestamps; warnings are replayed per call
+_parse_timestamp_cached = lru_cache(maxsize=4096)(_parse_timestamp)
+
 
 def parse_timestamp(timestamp_str: str) -> Optional[float]:
     """
@@ -31,29 +100,13 @@ def parse_timestamp(timestamp_str: str) -> Optional[float]:
     if not timestamp_str:
         return None
 
-    try:
-        timestamp_str = timestamp_str.strip()
-
-        # Handle milliseconds
-        milliseconds = 0.0
-        if "." in timestamp_str:
-            timestamp_str, ms_str = timestamp_str.rsplit(".", 1)
-            milliseconds = int(ms_str[:3]) / 1000.0
-
-        parts = timestamp_str.split(":")
-        if len(parts) == 2:
-            minutes, seconds = map(int, parts)
-            return minutes * 60 + seconds + milliseconds
-        elif len(parts) == 3:
-            hours, minutes, seconds = map(int, parts)
-            return hours * 3600 + minutes * 60 + seconds + milliseconds
-        else:
-            logger.warning(f"Invalid timestamp format: {timestamp_str}")
-            return None
-
-    except (ValueError, AttributeError) as e:
-        logger.warning(f"Failed to parse timestamp '{timestamp_str}': {e}")
-        return None
+    if isinstance(timestamp_str, str):
+        seconds, warning = _parse_timestamp_cached(timestamp_str)
+    else:
+        seconds, warning = _parse_timestamp(timestamp_str)
+    if warning:
+        logger.warning(*warning)
+    return seconds
 
 
 def format_timestamp(seconds: float) -> str:
@@ -73,7 +126,7 @@ def format_timestamp(seconds: float) -> str:
         '05:30'
     """
     if seconds < 0:
-        logger.warning(f"Negative seconds: {seconds}")
+        logger.warning("Negative seconds: %s", seconds)
         seconds = 0
 
     total_seconds = int(seconds)
@@ -81,58 +134,143 @@ def format_timestamp(seconds: float) -> str:
     minutes = (total_seconds % 3600) // 60
     secs = total_seconds % 60
 
+    # Zero-padded fields come from a lookup table; hours past 99 print as-is
     if hours > 0:
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        return f"{_D2[hours] if hours < 100 else hours}:{_D2[minutes]}:{_D2[secs]}"
     else:
-        return f"{minutes:02d}:{secs:02d}"
+        return f"{_D2[minutes]}:{_D2[secs]}"
 
 
-def parse_iso_date(date_str: str) -> Optional[datetime]:
+def format_timestamps(seconds_array) -> list[str]:
     """
-    Parse ISO format date string.
+    Format many durations at once; same output as format_timestamp per item.
 
-    Supports: "2025-12-21", "20251221", "2025-12-21T10:30:00Z"
+    With NumPy installed, hours/minutes/seconds for the whole batch are
+    split in one vectorized pass; without it (or for values NumPy can't
+    hold as int64, such as NaN) each item goes through format_timestamp.
 
     Args:
-        date_str: Date string in ISO format
+        seconds_array: Sequence or NumPy array of durations in seconds
 
     Returns:
-        datetime object or None if invalid
+        List of "HH:MM:SS" / "MM:SS" strings
 
     Examples:
-        >>> parse_iso_date("2025-12-21")
-        datetime.datetime(2025, 12, 21, 0, 0)
-        >>> parse_iso_date("20251221")
-        datetime.datetime(2025, 12, 21, 0, 0)
+        >>> format_timestamps([5025.0, 330.0])
+        ['01:23:45', '05:30']
     """
-    if not date_str:
+    if HAS_NUMPY:
+        values = np.asarray(seconds_array)
+        if values.dtype.kind == "f" and (np.abs(values) < 2.0 ** 62).all():
+            total = values.astype(np.int64)
+        elif values.dtype.kind in "iu":
+            total = values.astype(np.int64)
+        else:
+            total = None
+
+        if total is not None:
+            negative = int((values < 0).sum())
+            if negative:
+                logger.warning("Negative seconds in %d of %d values", negative, values.size)
+                total = np.maximum(total, 0)
+            hours, rem = np.divmod(total, 3600)
+            minutes, secs = np.divmod(rem, 60)
+            # tolist() hands back Python ints instead of boxing NumPy scalars
+            return [
+                f"{_D2[h] if h < 100 else h}:{_D2[m]}:{_D2[s]}" if h else f"{_D2[m]}:{_D2[s]}"
+                for h, m, s in zip(hours.tolist(), minutes.tolist(), secs.tolist())
+            ]
+
+    return [format_timestamp(seconds) for seconds in seconds_array]
+
+
+def _iso_fast_shape(date_str: str) -> Optional[str]:
+    """Return date_str (without a trailing "Z") if it has a fixed ISO layout, else None."""
+    n = len(date_str)
+    if n == 10:
+        return date_str if date_str[4] == "-" and date_str[7] == "-" else None
+    if n == 19 and date_str[10] in "T ":
+        pass
+    elif n == 20 and date_str[10] == "T" and date_str[19] == "Z":
+        date_str = date_str[:19]
+    else:
         return None
+    if date_str[4] == "-" and date_str[7] == "-" and date_str[13] == ":" and date_str[16] == ":":
+        return date_str
+    return None
+
 
+def _parse_iso_date(date_str: str) -> Tuple[Optional[datetime], Optional[tuple]]:
+    """Parse a date string; return (datetime, None) or (None, warning log args)."""
     try:
         date_str = date_str.strip()
 
-        # Try different formats
-        formats = [
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-            "%Y%m%d",
-        ]
+        # Fast path: one C-level fromisoformat() for the exact shapes the
+        # formats below describe ("YYYY-MM-DD", "YYYY-MM-DD[T ]HH:MM:SS" and
+        # the "T...Z" form, parsed naive). fromisoformat() accepts much more
+        # (offsets, week dates, any separator), so other shapes fall through.
+        iso = _iso_fast_shape(date_str)
+        if iso is not None:
+            try:
+                return datetime.fromisoformat(iso), None
+            except ValueError:
+                pass
+
+        # Compact "YYYYMMDD" (yt-dlp upload_date): build the date from slices.
+        # ASCII only, like strptime: int() would also take other digits ("２")
+        if len(date_str) == 8 and date_str.isascii() and date_str.isdigit():
+            try:
+                return datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:])), None
+            except ValueError:
+                pass
 
-        for fmt in formats:
+        # Try the formats that fit this length
+        for fmt in _FMTS_BY_LEN.get(len(date_str), _LONG_DATE_FORMATS):
             try:
-                return datetime.strptime(date_str, fmt)
+                return datetime.strptime(date_str, fmt), None
             except ValueError:
                 continue
 
-        logger.warning(f"Could not parse date: {date_str}")
-        return None
+        return None, ("Could not parse date: %s", date_str)
 
     except Exception as e:
-        logger.warning(f"Failed to parse date '{date_str}': {e}")
+        return None, ("Failed to parse date '%s': %s", date_str, str(e))
+
+
+# Feeds and archives repeat upload dates; datetime is immutable, so cached
+# results can be shared
+_parse_iso_date_cached = lru_cache(maxsize=1024)(_parse_iso_date)
+
+
+def parse_iso_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse ISO format date string.
+
+    Supports: "2025-12-21", "20251221", "2025-12-21T10:30:00Z"
+
+    Args:
+        date_str: Date string in ISO format
+
+    Returns:
+        datetime object or None if invalid
+
+    Examples:
+        >>> parse_iso_date("2025-12-21")
+        datetime.datetime(2025, 12, 21, 0, 0)
+        >>> parse_iso_date("20251221")
+        datetime.datetime(2025, 12, 21, 0, 0)
+    """
+    if not date_str:
         return None
 
+    if isinstance(date_str, str):
+        dt, warning = _parse_iso_date_cached(date_str)
+    else:
+        dt, warning = _parse_iso_date(date_str)
+    if warning:
+        logger.warning(*warning)
+    return dt
+
 
 def format_iso_date(dt: datetime) -> str:
     """
@@ -151,6 +289,12 @@ def format_iso_date(dt: datetime) -> str:
     return dt.strftime("%Y-%m-%d")
 
 
+@lru_cache(maxsize=32)
+def _lookback_td(hours: int) -> timedelta:
+    """Lookback window as a timedelta; callers reuse a handful of values."""
+    return timedelta(hours=hours)
+
+
 def is_recent(
     upload_date_str: str, lookback_hours: int, reference_time: Optional[datetime] = None
 ) -> bool:
@@ -172,14 +316,61 @@ def is_recent(
     if reference_time is None:
         reference_time = datetime.now()
 
-    upload_dt = parse_iso_date(upload_date_str)
-    if not upload_dt:
-        return False
-
-    cutoff_time = reference_time - timedelta(hours=lookback_hours)
+    # YouTube API "publishedAt" values ("2025-12-21T10:30:00Z") are parsed
+    # inline; other shapes and bad values go through parse_iso_date
+    upload_dt = None
+    if (
+        type(upload_date_str) is str
+        and len(upload_date_str) == 20
+        and upload_date_str[19] == "Z"
+        and upload_date_str[10] == "T"
+        and upload_date_str[4] == upload_date_str[7] == "-"
+        and upload_date_str[13] == upload_date_str[16] == ":"
+    ):
+        try:
+            upload_dt = datetime.fromisoformat(upload_date_str[:19])
+        except ValueError:
+            pass
+    if upload_dt is None:
+        upload_dt = parse_iso_date(upload_date_str)
+        if not upload_dt:
+            return False
+
+    cutoff_time = reference_time - _lookback_td(lookback_hours)
     return upload_dt >= cutoff_time
 
 
+def filter_recent(
+    upload_date_strs: list[str], lookback_hours: int, reference_time: Optional[datetime] = None
+) -> list[bool]:
+    """
+    Check a batch of upload dates against one lookback window.
+
+    Same result as calling is_recent() on each date, but the reference
+    time and cutoff are computed once for the whole batch.
+
+    Args:
+        upload_date_strs: Upload date strings (ISO format)
+        lookback_hours: How many hours to look back
+        reference_time: Reference time for calculation (defaults to now)
+
+    Returns:
+        One flag per date, True if that video is within the lookback period
+
+    Examples:
+        >>> filter_recent(["2025-12-21", "2025-01-01"], 24, datetime(2025, 12, 21, 12))
+        [True, False]
+    """
+    if reference_time is None:
+        reference_time = datetime.now()
+
+    cutoff_time = reference_time - _lookback_td(lookback_hours)
+    return [
+        upload_dt is not None and upload_dt >= cutoff_time
+        for upload_dt in map(parse_iso_date, upload_date_strs)
+    ]
+
+
 def seconds_to_duration_str(seconds: float) -> str:
     """
     Convert seconds to human-readable duration string.
@@ -215,6 +406,59 @@ def seconds_to_duration_str(seconds: float) -> str:
     return " ".join(parts)
 
 
+def _is_plain_number(text: str) -> bool:
+    """Return True if text is digits with at most one inner decimal point."""
+    head, dot, tail = text.partition(".")
+    return head.isdecimal() and (not dot or tail.isdecimal())
+
+
+def _scan_duration(text: str) -> float:
+    """
+    Sum every "<number><space>*<unit>" token in text, skipping anything else.
+
+    Numbers are digits with an optional ".digits" fraction; units are the
+    keys of _DURATION_UNITS.  Whitespace-separated tokens like "23m" are
+    handled without a character walk; any other layout ("1 h", "1h30m",
+    stray text) falls back to a single left-to-right scan.
+    """
+    total = 0.0
+    for token in text.split():
+        unit = _DURATION_UNITS.get(token[-1])
+        if unit is None or not _is_plain_number(token[:-1]):
+            break
+        total += float(token[:-1]) * unit
+    else:
+        return total
+
+    total = 0.0
+    n = len(text)
+    i = 0
+    while i < n:
+        if not text[i].isdecimal():
+            i += 1
+            continue
+        j = i + 1
+        while j < n and text[j].isdecimal():
+            j += 1
+        # On a failed match, the next possible number starts in the fraction
+        restart = j
+        if j + 1 < n and text[j] == "." and text[j + 1].isdecimal():
+            restart = j + 1
+            j += 2
+            while j < n and text[j].isdecimal():
+                j += 1
+        k = j
+        while k < n and text[k].isspace():
+            k += 1
+        unit = _DURATION_UNITS.get(text[k]) if k < n else None
+        if unit is None:
+            i = restart
+            continue
+        total += float(text[i:j]) * unit
+        i = k + 1
+    return total
+
+
 def duration_str_to_seconds(duration_str: str) -> Optional[float]:
     """
     Parse duration string to seconds.
@@ -246,28 +490,11 @@ def duration_str_to_seconds(duration_str: str) -> Optional[float]:
             return parse_timestamp(duration_str)
 
         # Try human-readable format
-        total = 0.0
-        pattern = r"(\d+(?:\.\d+)?)\s*([smhd])"
-
-        matches = re.findall(pattern, duration_str)
-        if not matches:
-            return None
-
-        for value_str, unit in matches:
-            value = float(value_str)
-            if unit == "s":
-                total += value
-            elif unit == "m":
-                total += value * 60
-            elif unit == "h":
-                total += value * 3600
-            elif unit == "d":
-                total += value * 86400
-
+        total = _scan_duration(duration_str)
         return total if total > 0 else None
 
     except Exception as e:
-        logger.warning(f"Failed to parse duration '{duration_str}': {e}")
+        logger.warning("Failed to parse duration '%s': %s", duration_str, e)
         return None
 
 
@@ -280,11 +507,13 @@ def get_time_range(start_sec: float, end_sec: float) -> str:
         end_sec: End time in seconds
 
     Returns:
-        Formatted range like "00:05:30 - 00:10:45"
+        Formatted range like "05:30 - 10:45" (format_timestamp on each end)
 
     Examples:
         >>> get_time_range(330.0, 645.0)
-        '00:05:30 - 00:10:45'
+        '05:30 - 10:45'
+        >>> get_time_range(3000.0, 5025.0)
+        '50:00 - 01:23:45'
     """
     start_str = format_timestamp(start_sec)
     end_str = format_timestamp(end_sec)
@@ -315,6 +544,59 @@ def overlaps(
     return start1 < end2 and start2 < end1
 
 
+def overlaps_batch(starts1, ends1, starts2, ends2):
+    """
+    Check every range of one set against every range of another.
+
+    With NumPy installed, builds the full (N, M) comparison in one
+    vectorized step instead of N * M overlaps() calls; without it, falls
+    back to those calls.  The result holds N * M booleans, so for very
+    large sets pass the first set in chunks and handle one block of rows
+    at a time.
+
+    Args:
+        starts1: Starts of the first N ranges (seconds)
+        ends1: Ends of the first N ranges (seconds)
+        starts2: Starts of the second M ranges (seconds)
+        ends2: Ends of the second M ranges (seconds)
+
+    Returns:
+        (N, M) booleans, a NumPy array or (without NumPy) a list of lists;
+        [i][j] is True if range i of the first set overlaps range j of
+        the second
+
+    Examples:
+        >>> result = overlaps_batch([100, 500], [300, 600], [200], [400])
+        >>> bool(result[0][0]), bool(result[1][0])
+        (True, False)
+    """
+    if not HAS_NUMPY:
+        second = list(zip(starts2, ends2))
+        return [
+            [overlaps(start1, end1, start2, end2) for start2, end2 in second]
+            for start1, end1 in zip(starts1, ends1)
+        ]
+
+    # Rows index the first set, columns the second; same test as overlaps()
+    starts1 = np.asarray(starts1)[:, None]
+    ends1 = np.asarray(ends1)[:, None]
+    return (starts1 < np.asarray(ends2)) & (np.asarray(starts2) < ends1)
+
+
+def _in_order_disjoint(ranges: list) -> bool:
+    """Return True if ranges are sorted by start and no range touches the next."""
+    try:
+        prev_start, prev_end = ranges[0]
+        for start, end in islice(ranges, 1, None):
+            if not (prev_start <= start and prev_end < start):
+                return False
+            prev_start, prev_end = start, end
+    except (TypeError, ValueError):
+        # Malformed input: let the general path raise its usual error
+        return False
+    return True
+
+
 def merge_ranges(ranges: list[Tuple[float, float]]) -> list[Tuple[float, float]]:
     """
     Merge overlapping time ranges.
@@ -332,18 +614,82 @@ def merge_ranges(ranges: list[Tuple[float, float]]) -> list[Tuple[float, float]]
     if not ranges:
         return []
 
-    # Sort by start time
-    sorted_ranges = sorted(ranges, key=lambda x: x[0])
+    # Sequential cues are often already merged; skip the sort for them
+    if isinstance(ranges, list) and len(ranges) > 1 and _in_order_disjoint(ranges):
+        return list(map(tuple, ranges))
 
-    merged = [sorted_ranges[0]]
-    for current_start, current_end in sorted_ranges[1:]:
-        last_start, last_end = merged[-1]
+    # Sort by start time
+    sorted_ranges = sorted(ranges, key=itemgetter(0))
 
+    # Grow merged ranges in parallel start/end lists; tuples are built once
+    last_start, last_end = sorted_ranges[0]
+    starts = [last_start]
+    ends = [last_end]
+    for current_start, current_end in islice(sorted_ranges, 1, None):
         if current_start <= last_end:
-            # Overlap - merge
-            merged[-1] = (last_start, max(last_end, current_end))
+            # Overlap - extend the current range (ties keep the earlier end, as max() does)
+            if current_end > last_end:
+                last_end = current_end
+                ends[-1] = current_end
         else:
-            # No overlap - add as new range
-            merged.append((current_start, current_end))
+            # No overlap - start a new range
+            starts.append(current_start)
+            ends.append(current_end)
+            last_end = current_end
+
+    return list(zip(starts, ends))
+
+
+def merge_ranges_arr(starts, ends):
+    """
+    Merge overlapping time ranges held as parallel start/end arrays.
 
-    return merged
+    Same merge as merge_ranges for callers that already keep ranges in
+    NumPy arrays: no per-range tuples are built, and the sort, running
+    end and per-range reduction all run inside NumPy.  Without NumPy the
+    ranges go through merge_ranges instead.
+
+    Args:
+        starts: Range starts (seconds), 1-D
+        ends: Range ends (seconds), same length as starts
+
+    Returns:
+        Tuple of (starts, ends) of the merged ranges: float64 arrays, or
+        lists of floats without NumPy
+
+    Raises:
+        ValueError: If starts and ends are not 1-D sequences of equal length
+
+    Examples:
+        >>> starts, ends = merge_ranges_arr([100, 200, 500], [300, 400, 600])
+        >>> [(float(s), float(e)) for s, e in zip(starts, ends)]
+        [(100.0, 400.0), (500.0, 600.0)]
+    """
+    if not HAS_NUMPY:
+        starts = [float(start) for start in starts]
+        ends = [float(end) for end in ends]
+        if len(starts) != len(ends):
+            raise ValueError("starts and ends must be 1-D arrays of equal length")
+        merged = merge_ranges(list(zip(starts, ends)))
+        return [start for start, _ in merged], [end for _, end in merged]
+
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    if starts.ndim != 1 or starts.shape != ends.shape:
+        raise ValueError("starts and ends must be 1-D arrays of equal length")
+    if starts.size == 0:
+        return np.empty(0), np.empty(0)
+
+    # Stable, so equal starts keep input order exactly as merge_ranges does
+    order = np.argsort(starts, kind="stable")
+    starts = starts[order]
+    ends = ends[order]
+
+    # A range opens a new merged range when it starts after every earlier
+    # range has ended
+    reach = np.maximum.accumulate(ends)
+    opens = np.empty(starts.size, dtype=bool)
+    opens[0] = True
+    np.greater(starts[1:], reach[:-1], out=opens[1:])
+    heads = np.flatnonzero(opens)
+    return starts[heads], np.maximum.reduceat(ends, heads)